@@ -1,30 +1,182 @@
 """API functions exposed to the frontend (equivalent to Tauri commands)"""
+import os
+import functools
+import re
+import sys
 import time
+import queue
+import logging
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, List, Any, Tuple, Callable, Optional
-from dataclasses import asdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Any, NamedTuple, Tuple, Callable, Optional
 from config import AppConfig, ServerConfig, LocalAppConfig, ServiceConfig
-from ssh_client import SSHClient, ContainerStatus
+from ssh_client import ContainerStatus
 from process_manager import get_process_manager
-from vctt_interface import VCTTInterface
+from ssh_pool import get_ssh_pool
+from log_streams import get_log_stream_manager
+
+log = logging.getLogger(__name__)
+
+# Strips everything but lowercase letters and digits for normalized container-name matching
+_NORM = re.compile(r'[^a-z0-9]')
+
+# Host validation patterns (used by _is_valid_host for every server on each save)
+_IPV4_RE = re.compile(r'^(\d{1,3}\.){3}\d{1,3}$')
+_HOSTNAME_RE = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9\-\.]*[a-zA-Z0-9])?$')
+
+# Seconds a get_status result is served from cache
+_STATUS_TTL = 3.0
+
+# Servers queried concurrently by get_all_status
+_STATUS_WORKERS = 32
+
+# Seconds get_vctt_status trusts a previous check of the VCTT install path
+_VCTT_PATH_TTL = 2.0
+
+# Most log output get_container_logs returns; older output beyond this is dropped
+_LOG_FETCH_CAP = 4 * 1024 * 1024
+
+# Container names listed per debug line in get_status (busy hosts run hundreds)
+_DEBUG_NAME_LIMIT = 20
+
+# Seconds a pooled session may be reused by test_connection before it re-handshakes
+_TEST_CONNECTION_MAX_AGE = 5.0
+
+
+def _debug_names(names: List[str]) -> str:
+    """Container names for a debug line, capped at _DEBUG_NAME_LIMIT"""
+    if len(names) <= _DEBUG_NAME_LIMIT:
+        return str(names)
+    return f"{names[:_DEBUG_NAME_LIMIT]} (+{len(names) - _DEBUG_NAME_LIMIT} more)"
+
+
+def _dir_entries(path: str) -> Dict[str, 'os.DirEntry[str]']:
+    """Entries of a directory by name from one scandir (empty if it can't be listed)"""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
+
+def _join_tail(chunks: Iterable[bytes], cap: int) -> str:
+    """Join streamed output keeping only the newest `cap` bytes (cut at a line boundary)"""
+    kept: Deque[bytes] = deque()
+    size = 0
+    truncated = False
+    for chunk in chunks:
+        kept.append(chunk)
+        size += len(chunk)
+        while size > cap and len(kept) > 1:
+            size -= len(kept.popleft())
+            truncated = True
+    data = b''.join(kept)
+    if len(data) > cap:
+        data = data[-cap:]
+        truncated = True
+    if truncated:
+        # Drop the partial first line left by the cut
+        data = data[data.find(b'\n') + 1:]
+    return data.decode('utf-8', errors='replace')
+
+
+class _ContainerIndex(NamedTuple):
+    """Running containers of one compose project, pre-lowered and normalized for matching"""
+    by_exact: Dict[str, ContainerStatus]  # lowercase name -> container
+    by_normalized: Dict[str, ContainerStatus]  # _NORM-stripped lowercase name -> container
+    running: List[Tuple[ContainerStatus, str, str]]  # (container, lowercase, normalized)
+
+
+def _index_running_containers(containers: List[ContainerStatus]) -> _ContainerIndex:
+    """Precompute lowercase and normalized names of running containers, in one pass"""
+    index = _ContainerIndex({}, {}, [])
+    for c in containers:
+        if c.state != "running":
+            continue
+        lower = c.name.lower()
+        normalized = _NORM.sub('', lower)
+        index.by_exact.setdefault(lower, c)
+        index.by_normalized.setdefault(normalized, c)
+        index.running.append((c, lower, normalized))
+    return index
+
+
+def _match_container(service: ServiceConfig, index: _ContainerIndex) -> Tuple[Optional[ContainerStatus], Optional[str]]:
+    """Find the running container for a service: returns (container, strategy) or (None, None)
+    
+    1. Exact match: "pipeline-management-tool" == "pipeline-management-tool" (O(1) lookup)
+    2. Normalized exact match: "pipeline_tool" ~ "Pipeline-Tool" (O(1) lookup)
+    3. Partial match (both directions):
+       - "pipeline-tool" in "data-pipeline-tool-1"
+       - "data-pipeline-tool-1" contains "pipeline-tool"
+    4. Normalized partial match: remove hyphens and compare
+    Only misses on both lookups fall through to the substring scans.
+    """
+    config_name_lower = service.container_name.lower()
+    
+    exact = index.by_exact.get(config_name_lower)
+    if exact is not None:
+        return exact, 'exact'
+    
+    config_normalized = _NORM.sub('', config_name_lower)
+    normalized = index.by_normalized.get(config_normalized)
+    if normalized is not None:
+        return normalized, 'normalized'
+    
+    for c, container_name_lower, _ in index.running:
+        if config_name_lower in container_name_lower or container_name_lower in config_name_lower:
+            return c, 'partial'
+    
+    for c, _, container_normalized in index.running:
+        if config_normalized in container_normalized or container_normalized in config_normalized:
+            return c, 'normalized'
+    
+    return None, None
 
 
 class API:
     """API class containing all command functions"""
     
     def __init__(self):
-        self.process_manager = get_process_manager()
+        self._process_manager = get_process_manager()
+        self._ssh_pool = get_ssh_pool()  # Reuses authenticated SSH connections across calls
+        self._log_streams = get_log_stream_manager()
         self._window_creator = None  # Callback to create windows
+        self._window_queue: 'queue.Queue[str]' = queue.Queue()  # Window types waiting to be opened
+        self._window_worker = None
+        self._vctt = None  # VCTTInterface, created on first VCTT call (see _vctt_interface)
+        self._vctt_path_checks: Dict[str, Tuple[float, bool]] = {}  # dir -> (checked at, valid)
+        
+        # Short-lived get_status cache so concurrent/rapid UI refreshes share one SSH trip
+        self._status_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._status_generation = 0  # Bumped on invalidation so in-flight fetches aren't cached
+        self._status_lock = threading.Lock()
+        
+        # Long-lived worker threads for get_all_status, reused across polls instead of
+        # spinning up a new pool (and its threads) on every refresh
+        self._status_executor = ThreadPoolExecutor(max_workers=_STATUS_WORKERS, thread_name_prefix='status')
+        
+        # In-flight SSH operations keyed by (operation, args...); concurrent identical calls share one
+        self._inflight: Dict[Tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # Tk is bound to the thread that created it, so folder dialogs all run on one
+        # worker thread that keeps a hidden root alive between calls (see browse_folder)
+        self._dialog_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tk-dialog')
+        self._tk_root = None
     
     def set_window_creator(self, creator_func: Callable[[str], None]):
         """Set a callback function to create windows (called from OrchestratorApp)"""
         self._window_creator = creator_func
+        if self._window_worker is None:
+            self._window_worker = threading.Thread(target=self._window_loop, name='window-creator', daemon=True)
+            self._window_worker.start()
     
     def launch_portal(self, server_id: str) -> str:
         """Launch the portal on the remote server (backward compatible - launches first service)"""
         try:
-            config = AppConfig.load()
+            config = AppConfig.load_cached()
             server = config.get_server(server_id)
             
             if not server:
@@ -44,7 +196,7 @@ class API:
         """Launch a specific service on a remote server"""
         try:
             print(f"Loading config for server_id: {server_id}, service_id: {service_id}")
-            config = AppConfig.load()
+            config = AppConfig.load_cached()
             result = config.get_service(server_id, service_id)
             
             if not result:
@@ -54,15 +206,10 @@ class API:
             
             print(f"Connecting to SSH server: {server.host}:{server.port}")
             # Connect to SSH
-            with SSHClient(
-                host=server.host,
-                port=server.port,
-                username=server.username,
-                ssh_key_path=server.ssh_key_path
-            ) as ssh:
+            with self._ssh_pool.acquire_for(server) as ssh:
                 print(f"Checking containers at: {service.path}")
-                # Check current status
-                containers = ssh.check_containers_at_path(service.path)
+                # Check current status (one exec, same probe get_status uses)
+                [(containers, _)] = ssh.bulk_service_status([service])
                 print(f"Found {len(containers)} containers")
                 service_running = any(
                     c.name == service.container_name and c.state == "running" 
@@ -73,22 +220,14 @@ class API:
                 # Start if not running
                 if not service_running:
                     print(f"Starting service {service.name}...")
-                    # Pass pre-launch command if specified
-                    ssh.start_service(service.path, None, service.pre_launch_command)
-                    print("Service start command sent")
-                    
-                    # Wait for service to be ready (with timeout)
-                    max_wait = 120  # 2 minutes
-                    waited = 0
-                    ready = False
-                    
-                    while waited < max_wait:
-                        time.sleep(2)
-                        waited += 2
-                        
-                        if ssh.check_service_health(service.port, service.healthcheck_path):
-                            ready = True
-                            break
+                    # Start (with the pre-launch command, if any) and wait for it to be ready;
+                    # the poll loop runs remotely, in the same exec as the start
+                    max_wait = service.health_max_wait
+                    ready = ssh.start_service_and_wait(
+                        service.path, None, service.pre_launch_command,
+                        service.port, service.healthcheck_path, max_wait,
+                        service.health_initial_interval, service.health_max_interval
+                    )
                     
                     if not ready:
                         # Service started but health check didn't pass
@@ -102,12 +241,15 @@ class API:
                 
         except Exception as e:
             raise Exception(f"Failed to launch service: {e}")
+        finally:
+            # Service state may have changed; make the next get_status re-query
+            self.invalidate_status(server_id)
     
     def stop_service(self, server_id: str, service_id: str) -> None:
         """Stop a specific service on a remote server"""
         try:
             print(f"Stopping service: {service_id} on server: {server_id}")
-            config = AppConfig.load()
+            config = AppConfig.load_cached()
             result = config.get_service(server_id, service_id)
             
             if not result:
@@ -115,131 +257,118 @@ class API:
             
             server, service = result
             
-            with SSHClient(
-                host=server.host,
-                port=server.port,
-                username=server.username,
-                ssh_key_path=server.ssh_key_path
-            ) as ssh:
+            with self._ssh_pool.acquire_for(server) as ssh:
                 print(f"Stopping service at: {service.path}")
                 ssh.stop_service(service.path, None)
                 print(f"Service {service.name} stopped")
                 
         except Exception as e:
             raise Exception(f"Failed to stop service: {e}")
+        finally:
+            # Service state may have changed; make the next get_status re-query
+            self.invalidate_status(server_id)
     
     def launch_local_app(self, app_id: str) -> None:
         """Launch a local application"""
         try:
-            config = AppConfig.load()
+            config = AppConfig.load_cached()
             app = config.get_local_app(app_id)
             
             if not app:
                 raise Exception(f"App not found: {app_id}")
             
-            self.process_manager.launch_app(app)
+            self._process_manager.launch_app(app)
             
         except Exception as e:
             raise Exception(f"Failed to launch app: {e}")
     
     def get_status(self, server_id: str) -> Dict[str, Any]:
-        """Get status of the remote server and all its services"""
+        """Get status of the remote server and all its services (cached for _STATUS_TTL seconds)"""
+        cached = self._cached_status(server_id)
+        if cached is not None:
+            return cached
+        
+        # Concurrent callers (several windows refreshing at once) share one SSH fetch
+        return self._coalesce(('status', server_id), functools.partial(self._fetch_and_cache_status, server_id))
+    
+    def _fetch_and_cache_status(self, server_id: str) -> Dict[str, Any]:
+        with self._status_lock:
+            generation = self._status_generation
+        status = self._fetch_status(server_id)
+        with self._status_lock:
+            if generation == self._status_generation:
+                self._status_cache[server_id] = (time.monotonic(), status)
+        return status
+    
+    def _coalesce(self, key: Tuple, fn: Callable[[], Any]) -> Any:
+        """Run fn once for concurrent callers with the same key; all of them get its result"""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not owner:
+            return future.result()
+        
         try:
-            config = AppConfig.load()
+            result = fn()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+    
+    def _cached_status(self, server_id: str) -> Optional[Dict[str, Any]]:
+        """Return the cached status for a server if it is still fresh"""
+        with self._status_lock:
+            cached = self._status_cache.get(server_id)
+        if cached and time.monotonic() - cached[0] < _STATUS_TTL:
+            return cached[1]
+        return None
+    
+    def invalidate_status(self, server_id: Optional[str] = None) -> None:
+        """Drop cached status for one server (or all servers) so the next get_status hits SSH"""
+        with self._status_lock:
+            self._status_generation += 1
+            if server_id is None:
+                self._status_cache.clear()
+            else:
+                self._status_cache.pop(server_id, None)
+        # Callers arriving from now on shouldn't join a fetch that started before the change
+        with self._inflight_lock:
+            for key in [k for k in self._inflight if k[0] == 'status' and server_id in (None, k[1])]:
+                del self._inflight[key]
+    
+    def _fetch_status(self, server_id: str) -> Dict[str, Any]:
+        """Query the remote server for its services' status"""
+        try:
+            config = AppConfig.load_cached()
             server = config.get_server(server_id)
             
             if not server:
                 raise Exception(f"Server not found: {server_id}")
             
             try:
-                with SSHClient(
-                    host=server.host,
-                    port=server.port,
-                    username=server.username,
-                    ssh_key_path=server.ssh_key_path
-                ) as ssh:
-                    # Get status for each service
+                with self._ssh_pool.acquire_for(server) as ssh:
+                    # Probe every service's containers and health check in one remote exec
+                    probes = ssh.bulk_service_status(server.services)
+                    
+                    # Index running containers once per compose path; services sharing
+                    # a path reuse it instead of re-lowering/normalizing every name
+                    indexes: Dict[str, _ContainerIndex] = {}
                     services_status = []
-                    for service in server.services:
-                        try:
-                            containers = ssh.check_containers_at_path(service.path)
-                        except Exception as e:
-                            print(f"Error checking containers at {service.path}: {e}")
-                            # Continue with empty containers list
-                            containers = []
-                        service_ready = ssh.check_service_health(service.port, service.healthcheck_path)
-                        
-                        # Debug logging
-                        print(f"\n=== Service: {service.name} ===")
-                        print(f"Configured container name: '{service.container_name}'")
-                        print(f"Containers found: {[c.name for c in containers]}")
-                        
-                        # Check if ANY container from this compose file is running
-                        service_running = any(c.state == "running" for c in containers)
-                        
-                        # Flexible container name matching:
-                        # 1. Exact match: "pipeline-management-tool" == "pipeline-management-tool"
-                        # 2. Partial match (both directions):
-                        #    - "pipeline-tool" in "data-pipeline-tool-1"
-                        #    - "data-pipeline-tool-1" contains "pipeline-tool"
-                        # 3. Normalized match: remove hyphens and compare
-                        main_container_running = False
-                        matched_container = None
-                        
-                        for c in containers:
-                            if c.state != "running":
-                                continue
-                            
-                            # Try multiple matching strategies
-                            config_name_lower = service.container_name.lower()
-                            container_name_lower = c.name.lower()
-                            
-                            # Strategy 1: Exact match
-                            if config_name_lower == container_name_lower:
-                                main_container_running = True
-                                matched_container = c.name
-                                print(f"✓ Matched (exact): {c.name}")
-                                break
-                            
-                            # Strategy 2: Partial match (bidirectional)
-                            if config_name_lower in container_name_lower or container_name_lower in config_name_lower:
-                                main_container_running = True
-                                matched_container = c.name
-                                print(f"✓ Matched (partial): {c.name}")
-                                break
-                            
-                            # Strategy 3: Normalized match (remove special chars)
-                            import re
-                            config_normalized = re.sub(r'[^a-z0-9]', '', config_name_lower)
-                            container_normalized = re.sub(r'[^a-z0-9]', '', container_name_lower)
-                            
-                            if config_normalized in container_normalized or container_normalized in config_normalized:
-                                main_container_running = True
-                                matched_container = c.name
-                                print(f"✓ Matched (normalized): {c.name}")
-                                break
-                        
-                        if not main_container_running and service_running:
-                            print(f"⚠ No container matched '{service.container_name}', but containers are running")
-                            print(f"  Tip: Set container name to match one of: {[c.name for c in containers if c.state == 'running']}")
-                        
-                        # If ANY container is running from this compose file, consider it running
-                        # This handles cases where the name doesn't match but service is actually up
-                        if not main_container_running and service_running:
-                            main_container_running = True
-                            print(f"✓ Using fallback: Any container running = service running")
-                        
-                        services_status.append({
-                            'id': service.id,
-                            'name': service.name,
-                            'url': f"http://{server.host}:{service.port}",
-                            'ready': service_ready,
-                            'running': main_container_running,
-                            'has_containers': service_running,
-                            'containers': [asdict(c) for c in containers],
-                            'container_count': len(containers),
-                            'matched_container': matched_container  # For debugging
-                        })
+                    for service, (containers, service_ready) in zip(server.services, probes):
+                        if service.path not in indexes:
+                            indexes[service.path] = _index_running_containers(containers)
+                        services_status.append(self._compute_service_status(
+                            server, service, containers, service_ready, indexes[service.path]
+                        ))
                     
                     return {
                         'server_id': server_id,
@@ -248,7 +377,7 @@ class API:
                         'services': services_status
                     }
             except Exception as e:
-                print(f"Error getting status for {server_id}: {e}")
+                log.warning("Error getting status for %s: %s", server_id, e)
                 return {
                     'server_id': server_id,
                     'server_name': server.name,
@@ -259,45 +388,101 @@ class API:
         except Exception as e:
             raise Exception(f"Failed to get status: {e}")
     
+    def _compute_service_status(self, server: ServerConfig, service: ServiceConfig,
+                                containers: List[ContainerStatus], service_ready: bool,
+                                index: Optional[_ContainerIndex] = None) -> Dict[str, Any]:
+        """Build the status entry for one service from its probed containers and health"""
+        if index is None:
+            index = _index_running_containers(containers)
+        # Debug logging (runs on every status poll, so only formatted when enabled)
+        debug = log.isEnabledFor(logging.DEBUG)
+        if debug:
+            log.debug("=== Service: %s ===", service.name)
+            log.debug("Configured container name: '%s'", service.container_name)
+            log.debug("Containers found: %s", _debug_names([c.name for c in containers]))
+        
+        # Check if ANY container from this compose file is running
+        service_running = bool(index.running)
+        
+        # Flexible container name matching against the precomputed running index.
+        # Fast path: the server's only service with a single container - nothing to match
+        if len(server.services) == 1 and len(containers) == 1:
+            matched, strategy = (containers[0], 'single') if service_running else (None, None)
+        else:
+            matched, strategy = _match_container(service, index)
+        main_container_running = matched is not None
+        matched_container = matched.name if matched else None
+        if debug and matched:
+            log.debug("✓ Matched (%s): %s", strategy, matched.name)
+        
+        if debug and not main_container_running and service_running:
+            log.debug("⚠ No container matched '%s', but containers are running", service.container_name)
+            log.debug("  Tip: Set container name to match one of: %s",
+                      _debug_names([c.name for c, _, _ in index.running]))
+        
+        # If ANY container is running from this compose file, consider it running
+        # This handles cases where the name doesn't match but service is actually up
+        if not main_container_running and service_running:
+            main_container_running = True
+            if debug:
+                log.debug("✓ Using fallback: Any container running = service running")
+        
+        return {
+            'id': service.id,
+            'name': service.name,
+            'url': f"http://{server.host}:{service.port}",
+            'ready': service_ready,
+            'running': main_container_running,
+            'has_containers': service_running,
+            'containers': [c.as_dict() for c in containers],
+            'container_count': len(containers),
+            'matched_container': matched_container  # For debugging
+        }
+    
+    def warm_connections(self) -> None:
+        """Connect to every configured server in the background, so the first status poll skips the handshakes"""
+        def warm_all():
+            for server in AppConfig.load_cached().servers:
+                self._status_executor.submit(self._warm_connection, server)
+        self._status_executor.submit(warm_all)
+    
+    def _warm_connection(self, server: ServerConfig) -> None:
+        try:
+            self._ssh_pool.warm(server)
+        except Exception as e:
+            # The first real call reports connection problems
+            log.debug("Could not pre-connect to %s: %s", server.name, e)
+    
     def get_all_status(self) -> List[Dict[str, Any]]:
         """Get status for all servers and their services (parallelized for speed)"""
         try:
-            config = AppConfig.load()
+            config = AppConfig.load_cached()
             
             if not config.servers:
                 return []
             
-            # Fetch status from all servers in parallel using ThreadPoolExecutor
-            all_status = []
-            with ThreadPoolExecutor(max_workers=min(len(config.servers), 10)) as executor:
-                # Submit all server status fetches
-                future_to_server = {
-                    executor.submit(self.get_status, server.id): server 
-                    for server in config.servers
-                }
-                
-                # Collect results as they complete
-                for future in as_completed(future_to_server):
-                    server = future_to_server[future]
-                    try:
-                        status = future.result()
-                        all_status.append(status)
-                    except Exception as e:
-                        print(f"Error fetching status for server {server.name}: {e}")
-                        # Add error status for this server
-                        all_status.append({
-                            'server_id': server.id,
-                            'server_name': server.name,
-                            'connected': False,
-                            'services': [],
-                            'error': str(e)
-                        })
-            
-            return all_status
+            # Fetch status from all servers in parallel on the shared status executor
+            # (network-bound: paramiko releases the GIL while waiting on SSH I/O).
+            # map() yields in config order so the UI doesn't reshuffle between polls
+            return list(self._status_executor.map(self._status_or_error, config.servers))
             
         except Exception as e:
             raise Exception(f"Failed to get all status: {e}")
     
+    def _status_or_error(self, server: ServerConfig) -> Dict[str, Any]:
+        """get_status for one server, turning failures into an error status entry"""
+        try:
+            return self.get_status(server.id)
+        except Exception as e:
+            log.warning("Error fetching status for server %s: %s", server.name, e)
+            return {
+                'server_id': server.id,
+                'server_name': server.name,
+                'connected': False,
+                'services': [],
+                'error': str(e)
+            }
+    
     def validate_server_config(self, servers: List[Dict[str, Any]]) -> Tuple[bool, str]:
         """
         Validate server configuration for duplicates and other issues.
@@ -308,57 +493,55 @@ class API:
         if not servers:
             return True, ""  # Empty is OK
         
-        # Check for duplicate server names
-        server_names = {}
+        # Single pass: each server is fully checked before moving on to the next
+        seen_names = set()
+        seen_hosts: Dict[str, str] = {}  # host:port -> name of the server using it
         for idx, server in enumerate(servers):
+            # Check for duplicate server names
             name = server.get('name', '').strip()
             if not name:
                 return False, f"Server {idx + 1} has an empty name. Server names are required."
             
-            if name in server_names:
+            if name in seen_names:
                 return False, f"Duplicate server name '{name}'. Server names must be unique."
-            server_names[name] = idx
-        
-        # Check for duplicate server IPs (host:port combination)
-        server_hosts = {}
-        for idx, server in enumerate(servers):
+            seen_names.add(name)
+            
+            label = server.get('name', f'Server {idx + 1}')
             host = server.get('host', '').strip()
             port = server.get('port', 22)
             
             if not host:
-                return False, f"Server '{server.get('name', f'Server {idx + 1}')}' has an empty host/IP address."
+                return False, f"Server '{label}' has an empty host/IP address."
             
             # Validate IP/hostname format (basic check)
             if not self._is_valid_host(host):
-                return False, f"Server '{server.get('name', f'Server {idx + 1}')}' has an invalid host/IP address: '{host}'"
+                return False, f"Server '{label}' has an invalid host/IP address: '{host}'"
             
             # Validate port range
             if not (1 <= port <= 65535):
-                return False, f"Server '{server.get('name', f'Server {idx + 1}')}' has an invalid port: {port}. Port must be between 1 and 65535."
+                return False, f"Server '{label}' has an invalid port: {port}. Port must be between 1 and 65535."
             
+            # Check for duplicate server IPs (host:port combination)
             host_key = f"{host}:{port}"
-            if host_key in server_hosts:
-                other_name = servers[server_hosts[host_key]].get('name', f'Server {server_hosts[host_key] + 1}')
-                return False, f"Duplicate server IP/Port '{host_key}'. Server '{server.get('name', f'Server {idx + 1}')}' conflicts with '{other_name}'."
-            server_hosts[host_key] = idx
+            if host_key in seen_hosts:
+                return False, f"Duplicate server IP/Port '{host_key}'. Server '{label}' conflicts with '{seen_hosts[host_key]}'."
+            seen_hosts[host_key] = label
             
             # Validate required fields
             if not server.get('username', '').strip():
-                return False, f"Server '{server.get('name', f'Server {idx + 1}')}' is missing a username."
+                return False, f"Server '{label}' is missing a username."
             
             if not server.get('ssh_key_path', '').strip():
-                return False, f"Server '{server.get('name', f'Server {idx + 1}')}' is missing an SSH key path."
+                return False, f"Server '{label}' is missing an SSH key path."
         
         return True, ""
     
     def _is_valid_host(self, host: str) -> bool:
         """Validate host/IP address format"""
-        import re
         host = host.strip()
         
         # IPv4 pattern
-        ipv4_pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-        if re.match(ipv4_pattern, host):
+        if _IPV4_RE.match(host):
             parts = host.split('.')
             return all(0 <= int(part) <= 255 for part in parts)
         
@@ -368,8 +551,7 @@ class API:
             return len(host) <= 45  # Max IPv6 length
         
         # Hostname pattern (letters, numbers, dots, hyphens)
-        hostname_pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9\-\.]*[a-zA-Z0-9])?$'
-        if re.match(hostname_pattern, host):
+        if _HOSTNAME_RE.match(host):
             return len(host) <= 253  # Max hostname length
         
         return False
@@ -384,9 +566,10 @@ class API:
             if not is_valid:
                 raise Exception(f"Configuration validation failed: {error_msg}")
             
-            # Convert dictionary to AppConfig
-            servers = [ServerConfig(**s) for s in servers_data]
-            local_apps = [LocalAppConfig(**app) for app in config_dict.get('local_apps', [])]
+            # Convert dictionary to AppConfig (services too - the saved instance
+            # is cached and handed to later callers as-is)
+            servers = [ServerConfig.from_dict(s) for s in servers_data]
+            local_apps = [LocalAppConfig.from_dict(app) for app in config_dict.get('local_apps', [])]
             
             config = AppConfig(
                 version=config_dict.get('version', '1.0'),
@@ -395,6 +578,7 @@ class API:
             )
             
             config.save()
+            self.invalidate_status()
             
         except Exception as e:
             raise Exception(f"Failed to save config: {e}")
@@ -402,29 +586,31 @@ class API:
     def load_config(self) -> Dict[str, Any]:
         """Load configuration"""
         try:
-            config = AppConfig.load()
-            
-            return {
-                'version': config.version,
-                'servers': [asdict(s) for s in config.servers],
-                'local_apps': [asdict(app) for app in config.local_apps],
-                'preferences': asdict(config.preferences)
-            }
+            config = AppConfig.load_cached()
+            return config.to_dict()
             
         except Exception as e:
             raise Exception(f"Failed to load config: {e}")
     
+    def load_config_json(self) -> str:
+        """Load configuration as a JSON string (skips building dicts for the bridge to re-encode)"""
+        try:
+            return AppConfig.load_cached_json()
+        except Exception as e:
+            raise Exception(f"Failed to load config: {e}")
+    
     def test_connection(self, server_dict: Dict[str, Any]) -> str:
         """Test SSH connection to a server"""
         try:
             print(f"Starting SSH connection test to {server_dict['username']}@{server_dict['host']}:{server_dict['port']}")
             print(f"Using SSH key: {server_dict['ssh_key_path']}")
             
-            with SSHClient(
-                host=server_dict['host'],
-                port=server_dict['port'],
-                username=server_dict['username'],
-                ssh_key_path=server_dict['ssh_key_path']
+            # Reuse a pooled session only if it proved healthy in the last few seconds,
+            # so repeated clicks are quick but a real test still does a fresh handshake
+            with self._ssh_pool.acquire(
+                server_dict['host'], server_dict['port'],
+                server_dict['username'], server_dict['ssh_key_path'],
+                max_age=_TEST_CONNECTION_MAX_AGE
             ) as ssh:
                 print("SSH connection established successfully!")
                 
@@ -440,14 +626,12 @@ class API:
     
     def is_app_running(self, app_id: str) -> bool:
         """Check if an app is currently running"""
-        is_running = self.process_manager.is_running(app_id)
-        print(f"[API] Checking if app {app_id} is running: {is_running}")
-        return is_running
+        return self._process_manager.is_running(app_id)
     
     def terminate_app(self, app_id: str) -> None:
         """Terminate a running app"""
         try:
-            self.process_manager.terminate(app_id)
+            self._process_manager.terminate(app_id)
         except Exception as e:
             raise Exception(f"Failed to terminate app: {e}")
     
@@ -455,7 +639,7 @@ class API:
         """Restart a specific container within a service"""
         try:
             print(f"Restarting container: {container_name} in service: {service_id} on server: {server_id}")
-            config = AppConfig.load()
+            config = AppConfig.load_cached()
             result = config.get_service(server_id, service_id)
             
             if not result:
@@ -463,24 +647,22 @@ class API:
             
             server, service = result
             
-            with SSHClient(
-                host=server.host,
-                port=server.port,
-                username=server.username,
-                ssh_key_path=server.ssh_key_path
-            ) as ssh:
+            with self._ssh_pool.acquire_for(server) as ssh:
                 print(f"Restarting container at: {service.path}")
                 ssh.restart_container(service.path, container_name)
                 print(f"Container {container_name} restarted")
                 
         except Exception as e:
             raise Exception(f"Failed to restart container: {e}")
+        finally:
+            # Service state may have changed; make the next get_status re-query
+            self.invalidate_status(server_id)
     
     def get_container_logs(self, server_id: str, service_id: str, container_name: str, lines: int = 200) -> str:
         """Get logs for a specific container"""
         try:
             print(f"Fetching logs for container: {container_name} in service: {service_id} on server: {server_id}")
-            config = AppConfig.load()
+            config = AppConfig.load_cached()
             result = config.get_service(server_id, service_id)
             
             if not result:
@@ -491,17 +673,17 @@ class API:
             # Limit lines to reasonable range
             lines = max(1, min(1000, int(lines)))
             
-            try:
-                with SSHClient(
-                    host=server.host,
-                    port=server.port,
-                    username=server.username,
-                    ssh_key_path=server.ssh_key_path
-                ) as ssh:
+            def fetch_logs() -> str:
+                with self._ssh_pool.acquire_for(server) as ssh:
                     # Use 2>&1 to capture both stdout and stderr (many apps log to stderr)
                     cmd = f"docker logs --tail {lines} --timestamps {container_name} 2>&1"
-                    output = ssh.execute_command(cmd)
-                    return output if output else "(no logs)"
+                    # Stream it so very long lines can't balloon memory past the cap
+                    return _join_tail(ssh.stream_command(cmd), _LOG_FETCH_CAP)
+            
+            try:
+                # Identical concurrent requests (e.g. the same container open twice) share one exec
+                output = self._coalesce(('logs', server_id, container_name, lines), fetch_logs)
+                return output if output else "(no logs)"
             except Exception as ssh_error:
                 return f"Error connecting to server: {ssh_error}"
                 
@@ -512,7 +694,7 @@ class API:
         """Get logs for a container since a specific timestamp"""
         try:
             print(f"Fetching incremental logs for container: {container_name} since: {since_timestamp}")
-            config = AppConfig.load()
+            config = AppConfig.load_cached()
             result = config.get_service(server_id, service_id)
             
             if not result:
@@ -521,12 +703,7 @@ class API:
             server, service = result
             
             try:
-                with SSHClient(
-                    host=server.host,
-                    port=server.port,
-                    username=server.username,
-                    ssh_key_path=server.ssh_key_path
-                ) as ssh:
+                with self._ssh_pool.acquire_for(server) as ssh:
                     # Docker accepts ISO 8601 timestamps or relative time (e.g., "2s")
                     # Use 2>&1 to capture both stdout and stderr (many apps log to stderr)
                     cmd = f"docker logs --since {since_timestamp} --timestamps {container_name} 2>&1"
@@ -538,28 +715,71 @@ class API:
         except Exception as e:
             return f"Error fetching logs: {e}"
     
+    def start_log_stream(self, server_id: str, service_id: str, container_name: str,
+                         since_timestamp: Optional[str] = None) -> str:
+        """Follow a container's logs over one long-lived SSH channel; returns a stream id
+        
+        Poll read_log_stream() for new output (no SSH round-trip per read) and call
+        stop_log_stream() when done. get_container_logs_since() remains as a fallback.
+        """
+        try:
+            config = AppConfig.load_cached()
+            result = config.get_service(server_id, service_id)
+            
+            if not result:
+                raise Exception(f"Service not found: {service_id} on server: {server_id}")
+            
+            server, _ = result
+            print(f"Starting log stream for container: {container_name} on server: {server_id}")
+            return self._log_streams.start(server, container_name, since_timestamp)
+            
+        except Exception as e:
+            raise Exception(f"Failed to start log stream: {e}")
+    
+    def read_log_stream(self, stream_id: str) -> Dict[str, Any]:
+        """Return log output received since the last read: {'logs', 'active', 'error'}"""
+        return self._log_streams.read(stream_id)
+    
+    def stop_log_stream(self, stream_id: str) -> None:
+        """Stop following a container's logs"""
+        self._log_streams.stop(stream_id)
+    
     def open_settings_window(self) -> None:
         """Open the Settings window"""
-        if self._window_creator:
-            # Create window in a separate thread to avoid blocking
-            threading.Thread(target=lambda: self._window_creator('settings'), daemon=True).start()
-        else:
-            raise Exception("Window creator not initialized")
+        self._request_window('settings')
     
     def open_status_window(self) -> None:
         """Open the Status window"""
-        if self._window_creator:
-            # Create window in a separate thread to avoid blocking
-            threading.Thread(target=lambda: self._window_creator('status'), daemon=True).start()
-        else:
+        self._request_window('status')
+    
+    def open_dashboard_window(self) -> None:
+        """Open (or bring to front) the dashboard window"""
+        self._request_window('home')
+    
+    def _request_window(self, window_type: str) -> None:
+        """Queue a window to be created by the window worker (avoids blocking the caller)"""
+        if not self._window_creator:
             raise Exception("Window creator not initialized")
+        self._window_queue.put(window_type)
+    
+    def _window_loop(self) -> None:
+        """Create queued windows one at a time on a single long-lived thread
+        
+        Serializing also means rapid repeat clicks focus the first window
+        instead of racing to create duplicates.
+        """
+        while True:
+            window_type = self._window_queue.get()
+            try:
+                self._window_creator(window_type)
+            except Exception:
+                log.exception("Failed to open %s window", window_type)
     
     def mark_setup_completed(self) -> None:
         """Mark the setup wizard as completed"""
         try:
-            config = AppConfig.load()
-            config.preferences.setup_completed = True
-            config.save()
+            with AppConfig.edit() as config:
+                config.preferences.setup_completed = True
             print("Setup wizard marked as completed")
         except Exception as e:
             raise Exception(f"Failed to mark setup as completed: {e}")
@@ -571,12 +791,12 @@ class API:
         """
         try:
             print("[VCTT] Checking status from config...")
-            config = AppConfig.load()
+            config = AppConfig.load_cached()
             
             # Look for VCTT in local_apps
             vctt_app = None
             for app in config.local_apps:
-                if 'VCTT' in app.name or 'vctt' in app.name.lower() or app.id.startswith('vctt'):
+                if 'vctt' in app.name.lower() or app.id.startswith('vctt'):
                     vctt_app = app
                     break
             
@@ -584,9 +804,8 @@ class API:
                 # Validate the path exists
                 from pathlib import Path
                 work_dir = Path(vctt_app.working_directory)
-                main_py = work_dir / "main.py"
                 
-                if work_dir.exists() and main_py.exists():
+                if self._vctt_path_valid(vctt_app.working_directory):
                     return {
                         "installed": True,
                         "configured": True,
@@ -623,6 +842,17 @@ class API:
                 "error": str(e)
             }
     
+    def _vctt_path_valid(self, working_directory: str) -> bool:
+        """Whether working_directory holds a VCTT main.py, cached for _VCTT_PATH_TTL seconds"""
+        now = time.monotonic()
+        cached = self._vctt_path_checks.get(working_directory)
+        if cached and now - cached[0] < _VCTT_PATH_TTL:
+            return cached[1]
+        # isfile implies the directory exists, so one stat covers both checks
+        valid = os.path.isfile(os.path.join(working_directory, "main.py"))
+        self._vctt_path_checks[working_directory] = (now, valid)
+        return valid
+    
     def run_vctt_bootstrap(self, install_dir: str) -> Dict[str, Any]:
         """
         Run VCTT bootstrap installer.
@@ -634,7 +864,7 @@ class API:
             Dictionary with success status and message
         """
         try:
-            interface = VCTTInterface()
+            interface = self._vctt_interface()
             # Note: bootstrap is interactive, so wait=False starts it but doesn't wait for completion
             # The installer window will guide the user through the process
             exit_code, message = interface.run_bootstrap(install_dir, wait=False)
@@ -661,8 +891,16 @@ class API:
         Returns:
             True if bootstrap is still running, False otherwise
         """
+        from vctt_interface import VCTTInterface
         return VCTTInterface.is_bootstrap_running(install_dir)
     
+    def _vctt_interface(self):
+        """Shared VCTTInterface; the module is only imported once VCTT is actually used"""
+        if self._vctt is None:
+            from vctt_interface import get_vctt_interface
+            self._vctt = get_vctt_interface()
+        return self._vctt
+    
     def configure_vctt_app(self, vctt_path: str, conda_env: str = "vtcc_test", check_only_provided_path: bool = False) -> str:
         """
         Automatically configure VCTT in local_apps after installation.
@@ -676,19 +914,30 @@ class API:
         Returns:
             App ID of the configured app
         """
+        # An install may just have finished; don't trust earlier path checks
+        self._vctt_path_checks.clear()
+        if self._vctt is not None:
+            self._vctt.invalidate_cache()
+        
         try:
             import time
             from pathlib import Path
             
-            config = AppConfig.load()
             base_path = Path(vctt_path)
             
-            # Determine the actual VCTT_app directory
+            # Determine the actual VCTT_app directory. One scandir per directory
+            # answers every "does X exist here" question below
+            entries = _dir_entries(vctt_path)
+            app_entries = {}
+            if 'VCTT_app' in entries and 'main.py' not in entries:
+                app_entries = _dir_entries(entries['VCTT_app'].path)
+            
             # Check if vctt_path is VCTT_app itself
-            if (base_path / "main.py").exists():
+            if 'main.py' in entries:
                 vctt_app_dir = base_path
+                app_entries = entries
             # Check if vctt_path/VCTT_app exists
-            elif (base_path / "VCTT_app" / "main.py").exists():
+            elif 'main.py' in app_entries:
                 vctt_app_dir = base_path / "VCTT_app"
             else:
                 # If check_only_provided_path is True, fail immediately without scanning
@@ -696,89 +945,69 @@ class API:
                     raise Exception(f"VCTT installation not found at {vctt_path}. Please ensure the installation completed successfully in the terminal window.")
                 
                 # Otherwise, try to find VCTT installations (fallback for browsing existing installations)
+                from vctt_interface import VCTTInterface
+                VCTTInterface.rescan_installations()
                 found = VCTTInterface.find_vctt_installations()
                 if found:
                     vctt_app_dir = found[0]
+                    app_entries = _dir_entries(str(vctt_app_dir))
                     print(f"Found VCTT installation at: {vctt_app_dir}")
                 else:
                     raise Exception(f"VCTT installation not found at {vctt_path}. Please ensure VCTT is installed.")
             
             # Validate it's a real VCTT installation
             main_py = vctt_app_dir / "main.py"
-            if not main_py.exists():
+            if 'main.py' not in app_entries:
                 raise Exception(f"main.py not found in {vctt_app_dir}. This doesn't appear to be a valid VCTT installation.")
             
             # Check for launch script - prefer using launch script over python main.py
-            launch_bat = vctt_app_dir / "launch_vctt.bat"
-            launch_sh = vctt_app_dir / "launch_vctt.sh"
-            
             # Determine which launch method to use
             use_launch_script = False
-            if launch_bat.exists():
-                executable = str(launch_bat)
+            if 'launch_vctt.bat' in app_entries:
+                executable = str(vctt_app_dir / "launch_vctt.bat")
                 use_launch_script = True
-            elif launch_sh.exists():
-                executable = str(launch_sh)
+            elif 'launch_vctt.sh' in app_entries:
+                executable = str(vctt_app_dir / "launch_vctt.sh")
                 use_launch_script = True
             else:
                 # Fallback to python main.py if launch script doesn't exist
                 executable = str(main_py)
                 print(f"Warning: Launch script not found, using python main.py directly")
             
-            # Check if VCTT is already configured
-            for app in config.local_apps:
-                if 'VCTT' in app.name or 'vctt' in app.name.lower():
-                    # Update existing config with validated path
-                    app.executable_path = executable
-                    app.working_directory = str(vctt_app_dir)
-                    if use_launch_script:
-                        # Use launch script directly (it handles conda internally)
-                        app.use_shell = True
-                        app.conda_env = None  # Launch script handles conda
-                        app.shell_command = None
-                    else:
-                        # Fallback: use shell with conda
+            # Changes go to a private copy, saved and published to load_cached() on exit
+            with AppConfig.edit() as config:
+                # Check if VCTT is already configured
+                for app in config.local_apps:
+                    if 'vctt' in app.name.lower():
+                        # Update existing config with validated path
+                        app.executable_path = executable
+                        app.working_directory = str(vctt_app_dir)
+                        # Launch script runs directly (it handles conda internally);
+                        # otherwise fall back to python main.py in the conda env
                         app.use_shell = True
-                        app.conda_env = conda_env
+                        app.conda_env = None if use_launch_script else conda_env
                         app.shell_command = None
-                    config.save()
-                    print(f"Updated VCTT configuration: {app.id} (using {'launch script' if use_launch_script else 'python main.py'})")
-                    return app.id
-            
-            # Create new VCTT app config
-            app_id = f"vctt-{int(time.time())}"
-            if use_launch_script:
-                # Use launch script directly (it handles conda internally)
-                vctt_app = LocalAppConfig(
-                    id=app_id,
-                    name="VCTT App",
-                    executable_path=executable,
-                    working_directory=str(vctt_app_dir),
-                    use_shell=True,
-                    conda_env=None,  # Launch script handles conda
-                    shell_command=None,
-                    install_dependencies=False,
-                    requirements_file=None
-                )
-            else:
-                # Fallback: use shell with conda
-                vctt_app = LocalAppConfig(
-                    id=app_id,
-                    name="VCTT App",
-                    executable_path=executable,
-                    working_directory=str(vctt_app_dir),
-                    use_shell=True,
-                    conda_env=conda_env,
-                    shell_command=None,
-                    install_dependencies=False,
-                    requirements_file=None
-                )
-            
-            config.local_apps.append(vctt_app)
-            config.save()
-            
-            print(f"VCTT configured as local app: {app_id} at {vctt_app_dir}")
-            return app_id
+                        action = "Updated VCTT configuration"
+                        break
+                else:
+                    # Create new VCTT app config
+                    app = LocalAppConfig(
+                        id=f"vctt-{int(time.time())}",
+                        name="VCTT App",
+                        executable_path=executable,
+                        working_directory=str(vctt_app_dir),
+                        use_shell=True,
+                        # Launch script handles conda itself; python main.py needs the env
+                        conda_env=None if use_launch_script else conda_env,
+                        shell_command=None,
+                        install_dependencies=False,
+                        requirements_file=None
+                    )
+                    config.local_apps.append(app)
+                    action = "VCTT configured as local app"
+            
+            print(f"{action}: {app.id} at {vctt_app_dir} (using {'launch script' if use_launch_script else 'python main.py'})")
+            return app.id
             
         except Exception as e:
             raise Exception(f"Failed to configure VCTT app: {e}")
@@ -795,21 +1024,7 @@ class API:
             Selected folder path or None if cancelled
         """
         try:
-            import tkinter as tk
-            from tkinter import filedialog
-            
-            # Create a hidden root window
-            root = tk.Tk()
-            root.withdraw()  # Hide the main window
-            root.attributes('-topmost', True)  # Bring to front
-            
-            # Open folder dialog
-            folder_path = filedialog.askdirectory(
-                title=title,
-                initialdir='~'
-            )
-            
-            root.destroy()
+            folder_path = self._dialog_executor.submit(self._ask_directory, title).result()
             
             if folder_path:
                 return folder_path
@@ -820,15 +1035,37 @@ class API:
             traceback.print_exc()
             return None
     
+    def _ask_directory(self, title: str) -> str:
+        """Show the folder dialog (runs on the dialog thread, which owns the Tk root)"""
+        import tkinter as tk
+        from tkinter import filedialog
+        
+        if self._tk_root is None:
+            # Hidden root window, created once; Tk startup is the slow part of the dialog
+            root = tk.Tk()
+            root.withdraw()  # Hide the main window
+            root.attributes('-topmost', True)  # Bring to front
+            self._tk_root = root
+        
+        return filedialog.askdirectory(parent=self._tk_root, title=title, initialdir='~')
+    
+    def close_dialogs(self) -> None:
+        """Destroy the hidden Tk root, if one was created"""
+        def destroy():
+            if self._tk_root is not None:
+                self._tk_root.destroy()
+                self._tk_root = None
+        self._dialog_executor.submit(destroy)
+        self._dialog_executor.shutdown(wait=False)
+    
     def open_url(self, url: str) -> bool:
         """Open a URL in the default browser"""
         try:
             import webbrowser
-            import platform
             
             # On macOS, PyWebView can sometimes interfere with webbrowser
             # Use subprocess as a fallback
-            if platform.system() == 'Darwin':
+            if sys.platform == 'darwin':
                 import subprocess
                 try:
                     subprocess.run(['open', url], check=True)
@@ -1,13 +1,53 @@
 """Configuration management for Orchestrator App"""
+import functools
 import json
 import os
-from dataclasses import dataclass, field, asdict
-from typing import Optional, List, Dict, Any, Tuple
+import sys
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from pathlib import Path
 
+try:
+    import orjson  # Optional: serializes the dataclasses directly, much faster than asdict + json
+except ImportError:
+    orjson = None
 
-@dataclass
-class ServiceConfig:
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> frozenset:
+    """Field names of a config dataclass, looked up once per class"""
+    return frozenset(f.name for f in fields(cls))
+
+
+class _PlainDict:
+    """Mixin for slotted config dataclasses: convert to and from plain dicts
+    
+    from_dict calls the dataclass-generated __init__ with the dict as keywords
+    (its specialized code beats any per-field Python loop); unknown keys are
+    ignored, missing ones take the field default.
+    to_dict reads the slots directly instead of asdict's recursive deep copy.
+    """
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        names = _field_names(cls)
+        if data.keys() <= names:
+            return cls(**data)
+        # Keys from a newer or hand-edited config: drop the ones we don't know
+        return cls(**{key: value for key, value in data.items() if key in names})
+
+
+_INTERNED_SERVICE_FIELDS = ('id', 'container_name', 'healthcheck_path')
+
+
+@dataclass(slots=True)
+class ServiceConfig(_PlainDict):
     """Service configuration for a Docker service on a server"""
     id: str
     name: str
@@ -16,10 +56,23 @@ class ServiceConfig:
     path: str
     healthcheck_path: str = "/"
     pre_launch_command: Optional[str] = None  # Optional command to run before starting service
+    # Health check wait after launch: backs off from initial to max interval (whole seconds),
+    # gives up after max_wait
+    health_max_wait: int = 120
+    health_initial_interval: int = 1
+    health_max_interval: int = 4
+    
+    def __post_init__(self):
+        # Ids, container names and health paths repeat across servers (and across every
+        # reload of the config): share one string object each
+        for name in _INTERNED_SERVICE_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
 
 
-@dataclass
-class ServerConfig:
+@dataclass(slots=True)
+class ServerConfig(_PlainDict):
     """Server configuration for SSH and Docker operations"""
     id: str
     name: str
@@ -28,10 +81,24 @@ class ServerConfig:
     username: str
     ssh_key_path: str
     services: List[ServiceConfig] = field(default_factory=list)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ServerConfig':
+        server = super(ServerConfig, cls).from_dict(data)
+        server.services = [
+            svc if isinstance(svc, ServiceConfig) else ServiceConfig.from_dict(svc)
+            for svc in server.services
+        ]
+        return server
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data = super(ServerConfig, self).to_dict()
+        data['services'] = [svc.to_dict() for svc in self.services]
+        return data
 
 
-@dataclass
-class LocalAppConfig:
+@dataclass(slots=True)
+class LocalAppConfig(_PlainDict):
     """Local application configuration"""
     id: str
     name: str
@@ -44,8 +111,8 @@ class LocalAppConfig:
     requirements_file: Optional[str] = None  # Path to requirements.txt
 
 
-@dataclass
-class Preferences:
+@dataclass(slots=True)
+class Preferences(_PlainDict):
     """User preferences"""
     auto_start_portal: bool = True
     minimize_to_tray: bool = True
@@ -53,17 +120,49 @@ class Preferences:
     setup_completed: bool = False  # Flag to track if first-run setup wizard has been completed
 
 
-@dataclass
+# Version written by this code; older files are migrated on load
+_CURRENT_VERSION = '2.0'
+
+# v1.0 -> v2.0: a server's portal_port/portal_path become its single 'ai-portal' service
+_V1_PORTAL_SERVICE = {
+    'id': 'ai-portal',
+    'name': 'AI Portal',
+    'container_name': 'ai-portal',
+    'healthcheck_path': '/',
+}
+_V1_PORTAL_RENAMES = (('portal_port', 'port'), ('portal_path', 'path'))
+_V1_SERVER_KEYS = ('id', 'name', 'host', 'port', 'username', 'ssh_key_path')
+
+
+# Parsed config reused by AppConfig.load_cached() until the file's (mtime, size) changes.
+# RLock because load() re-saves migrated configs, which updates the cache too.
+# 'json' memoizes the serialized form of 'cfg' for load_cached_json().
+_CACHE: Dict[str, Any] = {'stamp': None, 'cfg': None, 'json': None, 'lock': threading.RLock()}
+
+
+def _file_stamp(path: Path) -> Tuple[int, int]:
+    """(mtime_ns, size) - size catches rewrites within coarse mtime granularity"""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+@dataclass(slots=True)
 class AppConfig:
     """Main application configuration"""
     version: str = "1.0"
     servers: List[ServerConfig] = field(default_factory=list)
     local_apps: List[LocalAppConfig] = field(default_factory=list)
     preferences: Preferences = field(default_factory=Preferences)
-
+    
+    # Runtime state, not config: underscore-prefixed so serializers skip it
+    # Lookup indices by id (see _id_index)
+    _indexes: Dict[Any, Tuple[list, int, Dict[str, Any]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_config_path() -> Path:
-        """Get the config file path"""
+        """Get the config file path (resolved, and its directory created, once per process)"""
         if os.name == 'nt':  # Windows
             config_dir = Path(os.getenv('APPDATA')) / 'orchestrator-app'
         else:  # Mac/Linux
@@ -77,34 +176,19 @@ class AppConfig:
         """Load configuration from file with automatic migration"""
         config_path = cls.get_config_path()
         
-        if not config_path.exists():
-            return cls(version="2.0")
-        
         try:
-            with open(config_path, 'r') as f:
-                data = json.load(f)
+            # Open directly rather than exists() first: one less stat on every load.
+            # Both parsers take the raw bytes, so there's no intermediate str copy
+            raw = config_path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
             
+            data = cls._migrate(data)
             version = data.get('version', '1.0')
             
-            # Migrate from v1.0 to v2.0
-            if version == '1.0':
-                print("Migrating config from v1.0 to v2.0...")
-                data = cls._migrate_v1_to_v2(data)
-                version = '2.0'
-            
             # Convert dictionaries to dataclass instances
-            servers = []
-            for server_data in data.get('servers', []):
-                services_data = server_data.get('services', [])
-                services = [ServiceConfig(**s) for s in services_data]
-                
-                # Create ServerConfig without 'services' key first
-                server_dict = {k: v for k, v in server_data.items() if k != 'services'}
-                server = ServerConfig(**server_dict, services=services)
-                servers.append(server)
-            
-            local_apps = [LocalAppConfig(**app) for app in data.get('local_apps', [])]
-            preferences = Preferences(**data.get('preferences', {}))
+            servers = [ServerConfig.from_dict(server_data) for server_data in data.get('servers', [])]
+            local_apps = [LocalAppConfig.from_dict(app) for app in data.get('local_apps', [])]
+            preferences = Preferences.from_dict(data.get('preferences', {}))
             
             config = cls(
                 version=version,
@@ -120,75 +204,186 @@ class AppConfig:
             
             return config
             
+        except FileNotFoundError:
+            return cls(version=_CURRENT_VERSION)
         except Exception as e:
             print(f"Error loading config: {e}")
             import traceback
             traceback.print_exc()
-            return cls(version="2.0")
+            return cls(version=_CURRENT_VERSION)
+    
+    @classmethod
+    def load_cached(cls) -> 'AppConfig':
+        """Load configuration, reusing the parsed config while the file is unchanged"""
+        config_path = cls.get_config_path()
+        try:
+            stamp = _file_stamp(config_path)
+        except OSError:
+            return cls.load()
+        
+        with _CACHE['lock']:
+            if _CACHE['cfg'] is not None and _CACHE['stamp'] == stamp:
+                return _CACHE['cfg']
+            
+            config = cls.load()
+            # load() may have re-saved a migrated config, so stat again
+            try:
+                _CACHE['stamp'] = _file_stamp(config_path)
+                _CACHE['cfg'] = config
+                _CACHE['json'] = None
+            except OSError:
+                cls.invalidate_cache()
+            return config
+    
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Forget the cached config so the next load_cached() re-reads the file"""
+        with _CACHE['lock']:
+            _CACHE['stamp'] = None
+            _CACHE['cfg'] = None
+            _CACHE['json'] = None
+    
+    @classmethod
+    @contextmanager
+    def edit(cls) -> Iterator['AppConfig']:
+        """A private copy of the config to change; saved, and only then cached, on exit
+        
+        load_cached() hands every caller the same instance, so it must never be changed
+        in place. The cache lock is held throughout: concurrent edits apply one after
+        another, and readers see either the old config or the saved new one. If the
+        block raises, nothing is saved.
+        """
+        with _CACHE['lock']:
+            config = cls.load()
+            yield config
+            config.save()
+    
+    @classmethod
+    def load_cached_json(cls) -> str:
+        """JSON for load_cached(), serialized once per config version rather than per call"""
+        with _CACHE['lock']:
+            config = cls.load_cached()
+            if _CACHE['cfg'] is not config:
+                return config.to_json()  # Not cacheable (config file missing/unreadable)
+            if _CACHE['json'] is None:
+                _CACHE['json'] = config.to_json()
+            return _CACHE['json']
+    
+    @staticmethod
+    def _migrate(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run every migration step from data's version up to the current one"""
+        version = data.get('version', '1.0')
+        while version in _MIGRATIONS:
+            migrate = _MIGRATIONS[version]
+            data = migrate(data)
+            print(f"Migrated config from v{version} to v{data['version']}")
+            version = data['version']
+        return data
     
     @staticmethod
     def _migrate_v1_to_v2(data: Dict[str, Any]) -> Dict[str, Any]:
-        """Migrate config from v1.0 to v2.0 format"""
+        """Migrate config from v1.0 to v2.0 format (returns a new dict, data is not modified)"""
         migrated_servers = []
         
         for server in data.get('servers', []):
             # Check if old format (has portal_port and portal_path)
             if 'portal_port' in server and 'portal_path' in server:
                 # Create a service from the old portal_port and portal_path
-                service = {
-                    'id': 'ai-portal',
-                    'name': 'AI Portal',
-                    'container_name': 'ai-portal',
-                    'port': server['portal_port'],
-                    'path': server['portal_path'],
-                    'healthcheck_path': '/'
-                }
+                service = dict(_V1_PORTAL_SERVICE)
+                for old, new in _V1_PORTAL_RENAMES:
+                    service[new] = server[old]
                 
                 # Create new server without portal_port and portal_path
-                new_server = {
-                    'id': server['id'],
-                    'name': server['name'],
-                    'host': server['host'],
-                    'port': server['port'],
-                    'username': server['username'],
-                    'ssh_key_path': server['ssh_key_path'],
-                    'services': [service]
-                }
+                new_server = {key: server[key] for key in _V1_SERVER_KEYS}
+                new_server['services'] = [service]
                 migrated_servers.append(new_server)
             else:
                 # Already in new format
                 migrated_servers.append(server)
         
-        data['servers'] = migrated_servers
-        data['version'] = '2.0'
-        data['_migrated'] = True
-        
-        return data
+        # A new top-level dict: the caller's data is left as it was
+        return {**data, 'servers': migrated_servers, 'version': '2.0', '_migrated': True}
 
-    def save(self) -> None:
-        """Save configuration to file"""
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to plain dictionaries (as stored in config.json)"""
+        return {
+            'version': self.version,
+            'servers': [s.to_dict() for s in self.servers],
+            'local_apps': [app.to_dict() for app in self.local_apps],
+            'preferences': self.preferences.to_dict()
+        }
+    
+    def to_json(self, indent: bool = False) -> str:
+        """Serialize to JSON, without the intermediate asdict copy when orjson is installed"""
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            return orjson.dumps(self, option=option).decode('utf-8')
+        return json.dumps(self.to_dict(), indent=2 if indent else None)
+    
+    def to_json_bytes(self, indent: bool = False) -> bytes:
+        """to_json() as UTF-8, ready to write (orjson produces bytes natively, no str round trip)"""
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if indent else 0
+            return orjson.dumps(self, option=option)
+        return self.to_json(indent).encode('utf-8')
+    
+    def save(self, pretty: bool = False) -> None:
+        """Save configuration to file (compact JSON unless pretty, for hand-editing)
+        
+        Written to a temp file and swapped in with os.replace, so an interrupted
+        save leaves the previous config intact instead of a truncated file.
+        """
         config_path = self.get_config_path()
+        tmp_path = config_path.with_suffix('.json.tmp')
         
         try:
-            # Convert dataclasses to dictionaries
-            data = {
-                'version': self.version,
-                'servers': [asdict(s) for s in self.servers],
-                'local_apps': [asdict(app) for app in self.local_apps],
-                'preferences': asdict(self.preferences)
-            }
+            raw = self.to_json_bytes(indent=pretty)
             
-            with open(config_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            with _CACHE['lock']:
+                # Unbuffered: the document goes out in one write(), no BufferedWriter in between
+                with open(tmp_path, 'wb', buffering=0) as f:
+                    view = memoryview(raw)
+                    while view:
+                        view = view[f.write(view):]
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, config_path)
+                # What we just wrote is the current config - no need to re-read it
+                _CACHE['stamp'] = _file_stamp(config_path)
+                _CACHE['cfg'] = self
+                _CACHE['json'] = raw.decode('utf-8')  # Same document the frontend would get
         except Exception as e:
+            # The file may or may not have been replaced; re-read it next time
+            self.invalidate_cache()
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
             raise Exception(f"Failed to save config: {e}")
 
+    def _id_index(self, name: Any, items: list) -> Dict[str, Any]:
+        """{id: item} for one of the config lists, rebuilt only if the list was replaced or resized"""
+        cached = self._indexes.get(name)
+        if cached is None or cached[0] is not items or cached[1] != len(items):
+            # reversed() so the first item wins on duplicate ids, like a linear scan
+            cached = (items, len(items), {item.id: item for item in reversed(items)})
+            self._indexes[name] = cached
+        return cached[2]
+    
+    def _index_appended(self, name: Any, items: list) -> None:
+        """Add items[-1] to an already built index instead of letting the next lookup rebuild it"""
+        cached = self._indexes.get(name)
+        if cached is not None and cached[0] is items and cached[1] == len(items) - 1:
+            cached[2].setdefault(items[-1].id, items[-1])
+            self._indexes[name] = (items, len(items), cached[2])
+
     def get_server(self, server_id: str) -> Optional[ServerConfig]:
         """Get server by ID"""
-        for server in self.servers:
-            if server.id == server_id:
-                return server
-        return None
+        return self._id_index('servers', self.servers).get(server_id)
+    
+    def add_server(self, server: ServerConfig) -> None:
+        """Add a server (keeps the id index current, unlike servers.append)"""
+        self.servers.append(server)
+        self._index_appended('servers', self.servers)
     
     def get_service(self, server_id: str, service_id: str) -> Optional[Tuple[ServerConfig, ServiceConfig]]:
         """Get service by server ID and service ID"""
@@ -196,10 +391,10 @@ class AppConfig:
         if not server:
             return None
         
-        for service in server.services:
-            if service.id == service_id:
-                return (server, service)
-        return None
+        service = self._id_index(('services', server_id), server.services).get(service_id)
+        if service is None:
+            return None
+        return (server, service)
     
     def add_service(self, server_id: str, service: ServiceConfig) -> bool:
         """Add a service to a server"""
@@ -208,6 +403,7 @@ class AppConfig:
             return False
         
         server.services.append(service)
+        self._index_appended(('services', server_id), server.services)
         return True
     
     def remove_service(self, server_id: str, service_id: str) -> bool:
@@ -216,17 +412,22 @@ class AppConfig:
         if not server:
             return False
         
-        server.services = [s for s in server.services if s.id != service_id]
+        # Only copy the list when there's something to drop
+        if service_id in self._id_index(('services', server_id), server.services):
+            server.services = [s for s in server.services if s.id != service_id]
         return True
 
     def get_local_app(self, app_id: str) -> Optional[LocalAppConfig]:
         """Get local app by ID"""
-        for app in self.local_apps:
-            if app.id == app_id:
-                return app
-        return None
+        return self._id_index('local_apps', self.local_apps).get(app_id)
     
     def is_first_run(self) -> bool:
         """Check if this is a first-run (setup wizard not completed)"""
         return not self.preferences.setup_completed and len(self.servers) == 0
 
+
+# Config version -> step returning a config dict upgraded to the next version;
+# AppConfig._migrate chains them, so adding a version means adding one entry here
+_MIGRATIONS = {
+    '1.0': AppConfig._migrate_v1_to_v2,
+}
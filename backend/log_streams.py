@@ -0,0 +1,170 @@
+"""Follow container logs over long-lived SSH channels"""
+import codecs
+import socket
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+from config import ServerConfig
+from ssh_pool import get_ssh_pool
+
+# Buffered output kept per stream between reads (oldest chunks are dropped first)
+_MAX_BUFFERED_CHARS = 1_000_000
+
+# A stream nobody has read for this many seconds is stopped (its window went away
+# without calling stop_log_stream); the UI reads every second while a modal is open
+_UNREAD_TIMEOUT = 30.0
+_WATCHDOG_INTERVAL = 10.0
+
+
+class LogStream:
+    """One `docker logs -f` running on a pooled SSH connection, buffered for the UI"""
+
+    def __init__(self, server: ServerConfig, container_name: str, since_timestamp: Optional[str] = None):
+        self.server = server
+        self.container_name = container_name
+        self.since_timestamp = since_timestamp
+        self.error: Optional[str] = None
+        self._chunks: List[str] = []
+        self._buffered = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.last_read = time.monotonic()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Ask the reader thread to close its channel"""
+        self._stop.set()
+
+    @property
+    def active(self) -> bool:
+        return not self._done.is_set()
+
+    def read(self) -> str:
+        """Return the complete lines received since the last read"""
+        with self._lock:
+            self.last_read = time.monotonic()
+            text = ''.join(self._chunks)
+            self._chunks = []
+            self._buffered = 0
+            # Hold back a trailing partial line until the rest of it arrives
+            cut = text.rfind('\n') + 1
+            if cut < len(text) and self.active:
+                self._chunks.append(text[cut:])
+                self._buffered = len(text) - cut
+                text = text[:cut]
+        return text
+
+    def _append(self, text: str) -> None:
+        with self._lock:
+            self._chunks.append(text)
+            self._buffered += len(text)
+            while self._buffered > _MAX_BUFFERED_CHARS and len(self._chunks) > 1:
+                self._buffered -= len(self._chunks.pop(0))
+
+    def _run(self) -> None:
+        server = self.server
+        # Without a timestamp only follow new lines; the UI already loaded the tail
+        since = f"--since {self.since_timestamp}" if self.since_timestamp else "--tail 0"
+        cmd = f"docker logs -f {since} --timestamps {self.container_name} 2>&1"
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        try:
+            with get_ssh_pool().acquire_for(server) as ssh, ssh.open_stream(cmd) as channel:
+                while not self._stop.is_set():
+                    try:
+                        data = channel.recv(32768)
+                    except socket.timeout:
+                        continue  # Wake up periodically to check the stop flag
+                    if not data:
+                        break  # docker logs exited (container removed/stopped)
+                    self._append(decoder.decode(data))
+        except Exception as e:
+            print(f"Log stream for {self.container_name} failed: {e}")
+            self.error = str(e)
+        finally:
+            self._done.set()
+
+
+class LogStreamManager:
+    """Tracks active log streams by id"""
+
+    def __init__(self):
+        self.streams: Dict[str, LogStream] = {}
+        self._lock = threading.Lock()
+        self._watchdog = None
+
+    def start(self, server: ServerConfig, container_name: str, since_timestamp: Optional[str] = None) -> str:
+        """Start following a container's logs and return the stream id"""
+        stream = LogStream(server, container_name, since_timestamp)
+        stream_id = uuid.uuid4().hex
+        with self._lock:
+            self.streams[stream_id] = stream
+            self._start_watchdog()
+        stream.start()
+        return stream_id
+
+    def read(self, stream_id: str) -> Dict[str, Any]:
+        """Drain a stream's buffered output; finished streams are forgotten once drained"""
+        with self._lock:
+            stream = self.streams.get(stream_id)
+        if stream is None:
+            return {'logs': '', 'active': False, 'error': f"Unknown log stream: {stream_id}"}
+
+        active = stream.active
+        logs = stream.read()
+        if not active:
+            with self._lock:
+                self.streams.pop(stream_id, None)
+        return {'logs': logs, 'active': active, 'error': stream.error}
+
+    def stop(self, stream_id: str) -> None:
+        """Stop a stream and forget it"""
+        with self._lock:
+            stream = self.streams.pop(stream_id, None)
+        if stream:
+            stream.stop()
+
+    def _start_watchdog(self) -> None:
+        """Start the unread-stream watchdog thread (caller holds self._lock)"""
+        if self._watchdog is None:
+            self._watchdog = threading.Thread(target=self._watchdog_loop, daemon=True)
+            self._watchdog.start()
+
+    def _watchdog_loop(self) -> None:
+        while True:
+            time.sleep(_WATCHDOG_INTERVAL)
+            self.stop_unread()
+
+    def stop_unread(self) -> None:
+        """Stop streams nobody has read within _UNREAD_TIMEOUT"""
+        now = time.monotonic()
+        with self._lock:
+            stale = [
+                stream_id for stream_id, stream in self.streams.items()
+                if now - stream.last_read > _UNREAD_TIMEOUT
+            ]
+            streams = [self.streams.pop(stream_id) for stream_id in stale]
+        for stream in streams:
+            print(f"Stopping log stream for {stream.container_name}: not read for {_UNREAD_TIMEOUT:g}s")
+            stream.stop()
+
+    def stop_all(self) -> None:
+        """Stop every active stream"""
+        with self._lock:
+            streams = list(self.streams.values())
+            self.streams.clear()
+        for stream in streams:
+            stream.stop()
+
+
+# Global log stream manager instance
+_log_stream_manager = LogStreamManager()
+
+
+def get_log_stream_manager() -> LogStreamManager:
+    """Get the global log stream manager instance"""
+    return _log_stream_manager
@@ -1,16 +1,19 @@
 """Main application entry point with PyWebView and system tray"""
 import webview
+import functools
 import sys
-import os
 from pathlib import Path
-from PIL import Image
-import pystray
-from pystray import MenuItem as Item, Menu
 import threading
-import http.server
-import socketserver
+import logging
 from api import get_api
 from process_manager import get_process_manager
+from ssh_pool import get_ssh_pool
+from log_streams import get_log_stream_manager
+
+log = logging.getLogger(__name__)
+
+# Decoded tray images by path, kept for the life of the process
+_ICON_CACHE = {}
 
 
 class OrchestratorApp:
@@ -33,47 +36,147 @@ class OrchestratorApp:
         if not icons_path.exists():
             icons_path = self.project_root / 'src-tauri' / 'icons'
         self.icons_dir = icons_path
+        icon_path = icons_path / 'icon.png'
+        if not icon_path.exists():
+            # Fallback to 32x32
+            icon_path = icons_path / '32.png'
+        self._icon_path = str(icon_path)
+        self._page_cache = {}  # URL path -> built HTML bytes, served from memory by the local server
+        self.reload_html_paths()
+        self._vite_url = None  # '' once probed and not found
+        self._prewarmed = set()  # Window types created hidden and not shown yet
         
         # Register window creator callback with API so it can open windows
         self.api.set_window_creator(self.create_window)
     
+    # window_type -> (built file under dist/, dev file, title, size); resolved by reload_html_paths
+    # into (html file or None, URL on the local server or None, title, size)
+    _WINDOW_PAGES = {
+        'home': (('dist', 'home.html'), 'home.html',
+                 'PLATONIC - Pantheon Lab Tools Orchestration for Integration and Control', (1280, 740)),
+        'settings': (('dist', 'src', 'settings.html'), 'settings.html', 'PLATONIC - Settings', (600, 700)),
+        'status': (('dist', 'src', 'status.html'), 'status.html', 'PLATONIC - Status', (800, 600)),
+    }
+    
+    def reload_html_paths(self):
+        """Resolve each window's HTML file, preferring the built version (re-run after a build)"""
+        paths = {}
+        for window_type, (built_parts, dev_name, title, size) in self._WINDOW_PAGES.items():
+            built = self.project_root.joinpath(*built_parts)
+            if built.exists():
+                # Built pages are served by the local HTTP server (see start_local_server)
+                url = f"http://localhost:{self.http_port}/{'/'.join(built_parts[1:])}"
+                paths[window_type] = (built, url, title, size)
+            else:
+                # Fallback to src/ for development
+                dev = self.src_dir / dev_name
+                paths[window_type] = (dev if dev.exists() else None, None, title, size)
+        index = self.src_dir / 'index.html'
+        self._fallback_page = (index if index.exists() else None, None, 'Orchestrator', (400, 300))
+        self._html_paths = paths
+        if self.http_server:
+            self._preload_pages()
+    
+    def _preload_pages(self):
+        """Read the built HTML pages into memory so the local server doesn't hit disk for them"""
+        pages = {}
+        for window_type, (built_parts, _, _, _) in self._WINDOW_PAGES.items():
+            html_file, url, _, _ = self._html_paths[window_type]
+            if url:
+                try:
+                    pages['/' + '/'.join(built_parts[1:])] = html_file.read_bytes()
+                except OSError:
+                    pass  # Served from disk instead
+        # Updated in place: the running server's handler holds this dict
+        self._page_cache.clear()
+        self._page_cache.update(pages)
+    
+    def find_vite_dev_server(self):
+        """URL of home.html on a running Vite dev server, or None (probed once)"""
+        if self._vite_url is None:
+            import socket
+            import urllib.request
+            url = ''
+            try:
+                # Cheap connect check first so a closed port costs ~nothing, not an HTTP timeout.
+                # 'localhost' rather than 127.0.0.1: Vite may listen on ::1 only
+                socket.create_connection(('localhost', 1420), timeout=0.1).close()
+                response = urllib.request.urlopen('http://localhost:1420/home.html', timeout=1)
+                response.close()
+                url = 'http://localhost:1420/home.html'
+            except Exception:
+                # Vite dev server not running
+                pass
+            self._vite_url = url
+        return self._vite_url or None
+    
     def start_local_server(self, directory: Path, port: int = 8765):
         """Start a local HTTP server to serve static files"""
+        # Imported here: only needed when serving a built dist/
+        import http.server
+        
+        pages = self._page_cache
+        
         class Handler(http.server.SimpleHTTPRequestHandler):
             def __init__(self, *args, **kwargs):
                 super().__init__(*args, directory=str(directory), **kwargs)
             
+            def do_GET(self):
+                # Window pages come from memory; assets go through the normal file handler
+                body = pages.get(self.path.split('?', 1)[0])
+                if body is None:
+                    return super().do_GET()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Cache-Control', 'no-cache')
+                self.end_headers()
+                self.wfile.write(body)
+            
             def log_message(self, format, *args):
                 # Suppress HTTP server logs unless debugging
                 pass
         
         try:
-            # Don't use 'with' statement - we want the server to persist
-            httpd = socketserver.TCPServer(("", port), Handler)
-            # Allow address reuse to avoid "Address already in use" errors
-            httpd.allow_reuse_address = True
+            # Don't use 'with' statement - we want the server to persist.
+            # Threaded so the webview's parallel asset requests aren't served one by one;
+            # HTTPServer sets allow_reuse_address (before binding) and daemon_threads.
+            # Localhost only: nothing else should load these files
+            httpd = http.server.ThreadingHTTPServer(("127.0.0.1", port), Handler)
             self.http_server = httpd
+            self._preload_pages()
             server_thread = threading.Thread(target=httpd.serve_forever, daemon=True)
             server_thread.start()
-            print(f"Started local HTTP server on port {port}")
+            log.info("Started local HTTP server on port %s", port)
             return True
         except OSError as e:
-            print(f"Could not start HTTP server on port {port}: {e}")
+            log.warning("Could not start HTTP server on port %s: %s", port, e)
             return False
     
     def get_icon_path(self):
-        """Get the tray icon path"""
-        icon_path = self.icons_dir / 'icon.png'
-        if not icon_path.exists():
-            # Fallback to 32x32
-            icon_path = self.icons_dir / '32.png'
-        return str(icon_path)
+        """Get the tray icon path (resolved in __init__)"""
+        return self._icon_path
+    
+    def get_tray_image(self):
+        """Get the decoded tray icon image, loading it on first use"""
+        icon_path = self.get_icon_path()
+        image = _ICON_CACHE.get(icon_path)
+        if image is None:
+            from PIL import Image
+            # Image.open is lazy and keeps the file open; decode fully and keep
+            # an in-memory copy so the handle is released right away
+            with Image.open(icon_path) as im:
+                im.load()
+                image = im.copy()
+            _ICON_CACHE[icon_path] = image
+        return image
     
     def create_tray_icon(self):
-        """Create the system tray icon"""
+        """Create the system tray icon and run its loop (blocks; runs on the tray thread)"""
         try:
-            icon_path = self.get_icon_path()
-            image = Image.open(icon_path)
+            # Imported here: only needed when the tray is enabled
+            import pystray
+            from pystray import MenuItem as Item, Menu
             
             menu = Menu(
                 Item('Open Dashboard', self.on_open_dashboard),
@@ -86,56 +189,47 @@ class OrchestratorApp:
             
             self.tray_icon = pystray.Icon(
                 "orchestrator",
-                image,
+                self.get_tray_image(),
                 "Platonic",
                 menu
             )
+            self.tray_icon.run()
             
-            # Run tray icon in separate thread
-            threading.Thread(target=self.tray_icon.run, daemon=True).start()
-            
         except Exception as e:
-            print(f"Failed to create tray icon: {e}")
+            log.warning("Failed to create tray icon: %s. Application will continue without tray icon.", e)
+    
+    @staticmethod
+    def _warm_imports():
+        """Import modules first needed on user actions, so the first click doesn't pay for them"""
+        try:
+            import traceback
+            import webbrowser
+            import tkinter
+            from tkinter import filedialog
+        except Exception as e:
+            log.debug("Import warm-up skipped: %s", e)
     
     def on_open_dashboard(self, icon=None, item=None):
         """Open/show the dashboard window"""
-        def show_dashboard():
-            if 'home' in self.windows and self.windows['home']:
-                # Window exists, restore and show it on top
-                try:
-                    self.windows['home'].restore()
-                    self.windows['home'].show()
-                except:
-                    # If showing fails, create a new window
-                    self.create_window('home')
-            else:
-                # Create new dashboard window
-                self.create_window('home')
-        
-        # Run in separate thread to avoid blocking the tray
-        threading.Thread(target=show_dashboard, daemon=True).start()
+        # Queued to the API's window-creator thread so the tray isn't blocked;
+        # create_window restores the existing window if there is one
+        self.api.open_dashboard_window()
     
-
     def on_settings(self, icon=None, item=None):
         """Open Settings window"""
-        def create_settings():
-            self.create_window('settings')
-        
-        # Run in separate thread to avoid blocking the tray
-        threading.Thread(target=create_settings, daemon=True).start()
+        self.api.open_settings_window()
     
     def on_status(self, icon=None, item=None):
         """Open Status window"""
-        def create_status():
-            self.create_window('status')
-        
-        # Run in separate thread to avoid blocking the tray
-        threading.Thread(target=create_status, daemon=True).start()
+        self.api.open_status_window()
     
     def on_quit(self, icon=None, item=None):
         """Quit application"""
         self.running = False
         self.process_manager.cleanup_all()
+        get_log_stream_manager().stop_all()
+        get_ssh_pool().close_all()
+        self.api.close_dialogs()
         
         if self.tray_icon:
             self.tray_icon.stop()
@@ -152,77 +246,67 @@ class OrchestratorApp:
     
     def create_window(self, window_type):
         """Create a webview window or focus existing one"""
-        # Check if window already exists and hasn't been closed
-        if window_type in self.windows and self.windows[window_type]:
-            existing_window = self.windows[window_type]
-            # Check if window still exists (hasn't been destroyed)
-            # PyWebView windows lose their internal state when closed
+        # The closing handler clears a window's entry, so a registered window is still open;
+        # no need to probe it with a property read (a blocking call into the GUI thread)
+        existing_window = self.windows.get(window_type)
+        if existing_window is not None:
             try:
-                # Try to access window properties to check if it's still valid
-                _ = existing_window.width
-                # Window is still valid, restore and focus it
+                if window_type in self._prewarmed:
+                    # Created hidden and blank at startup; load its page now
+                    self._prewarmed.discard(window_type)
+                    existing_window.load_url(self._window_source(window_type))
                 # Use restore() to bring back minimized windows, then show() to focus
                 existing_window.restore()
                 existing_window.show()
-                print(f"Restored and focused existing {window_type} window")
+                log.info("Restored and focused existing %s window", window_type)
                 return existing_window
             except:
                 # Window was closed or is invalid, remove from dict
-                print(f"Existing {window_type} window was closed, creating new one")
+                log.info("Existing %s window was closed, creating new one", window_type)
                 self.windows[window_type] = None
         
-        # Determine window properties based on type
-        use_http_server = False
-        if window_type == 'home':
-            # For home dashboard, try to load built version first
-            html_file = self.project_root / 'dist' / 'home.html'
-            if not html_file.exists():
-                # Fallback to src/ for development
-                html_file = self.src_dir / 'home.html'
-            else:
-                use_http_server = True
-            title = 'PLATONIC - Pantheon Lab Tools Orchestration for Integration and Control'
-            width, height = 1280, 740
-        elif window_type == 'settings':
-            # Try built version first
-            html_file = self.project_root / 'dist' / 'src' / 'settings.html'
-            if not html_file.exists():
-                html_file = self.src_dir / 'settings.html'
-            else:
-                use_http_server = True
-            title = 'PLATONIC - Settings'
-            width, height = 600, 700
-        elif window_type == 'status':
-            # Try built version first
-            html_file = self.project_root / 'dist' / 'src' / 'status.html'
-            if not html_file.exists():
-                html_file = self.src_dir / 'status.html'
-            else:
-                use_http_server = True
-            title = 'PLATONIC - Status'
-            width, height = 800, 600
-        else:
-            html_file = self.src_dir / 'index.html'
-            title = 'Orchestrator'
-            width, height = 400, 300
+        html_source = self._window_source(window_type)
+        if html_source is None:
+            log.error("HTML file not found for %s window", window_type)
+            return None
         
-        if not html_file.exists():
-            print(f"HTML file not found: {html_file}")
+        return self._open_window(window_type, html_source)
+    
+    def _window_source(self, window_type):
+        """URL or file path to load for a window type (None if its page wasn't found)"""
+        # Window properties and the HTML file were resolved once at startup
+        html_file, url, _, _ = self._html_paths.get(window_type, self._fallback_page)
+        
+        if html_file is None:
             return None
         
-        # If using HTTP server (for built versions), convert file path to URL
-        if use_http_server and self.http_server:
-            # Convert absolute path to relative path from dist directory
-            try:
-                relative_path = html_file.relative_to(self.project_root / 'dist')
-                url = f"http://localhost:{self.http_port}/{relative_path}"
-                print(f"Loading {window_type} from HTTP server: {url}")
-                html_source = url
-            except ValueError:
-                # Fallback to file path if not in dist
-                html_source = str(html_file)
-        else:
-            html_source = str(html_file)
+        # Built versions load from the HTTP server when it's running
+        if url and self.http_server:
+            log.info("Loading %s from HTTP server: %s", window_type, url)
+            return url
+        if window_type == 'home' and self._vite_url:
+            # Dev mode: reopen the dashboard from the Vite server run() found
+            return self._vite_url
+        return str(html_file)
+    
+    def _prewarm_window(self, window_type):
+        """Create a window hidden, so its webview is initialized before the user opens it
+        
+        It starts on a blank page, so the page's scripts don't run until it's shown.
+        """
+        if self.windows.get(window_type) is not None:
+            return
+        if self._window_source(window_type) is None:
+            return
+        try:
+            self._open_window(window_type, None, hidden=True, html='<html></html>')
+            self._prewarmed.add(window_type)
+        except Exception as e:
+            log.warning("Could not prewarm %s window: %s", window_type, e)
+    
+    def _open_window(self, window_type, html_source, **options):
+        """Create a window from its spec and register it (shared by create_window and run)"""
+        _, _, title, (width, height) = self._html_paths.get(window_type, self._fallback_page)
         
         # Create window with API exposed
         # Note: js_api exposes the API object as window.pywebview.api
@@ -232,68 +316,77 @@ class OrchestratorApp:
             width=width,
             height=height,
             resizable=True,
-            hidden=False,
-            js_api=self.api  # Expose API to this window as window.pywebview.api
+            hidden=options.pop('hidden', False),
+            js_api=self.api,  # Expose API to this window as window.pywebview.api
+            **options
         )
         
-        # Set up event handler to clear window from dict when closed
-        def on_closing():
-            print(f"{window_type} window closing, removing from registry")
-            self.windows[window_type] = None
-        
-        window.events.closing += on_closing
+        # Clear the window from the registry when it closes
+        window.events.closing += functools.partial(self._on_window_closing, window_type)
         
         self.windows[window_type] = window
-        print(f"Created {window_type} window")
+        log.info("Created %s window", window_type)
         return window
     
+    def _on_window_closing(self, window_type):
+        """Closing handler for every window (bound per window type with functools.partial)"""
+        log.info("%s window closing, removing from registry", window_type)
+        self.windows[window_type] = None
+        self._prewarmed.discard(window_type)
+        
+        # A hidden prewarmed window still keeps webview.start() running; once no visible
+        # window is left, close it too so the app exits as it did without prewarming
+        if self._prewarmed and all(
+            window is None or other in self._prewarmed for other, window in self.windows.items()
+        ):
+            for other in list(self._prewarmed):
+                self._prewarmed.discard(other)
+                window = self.windows.get(other)
+                if window is not None:
+                    try:
+                        window.destroy()
+                    except Exception as e:
+                        log.warning("Could not close prewarmed %s window: %s", other, e)
+    
     def run(self):
         """Run the application"""
-        import platform
-        
-        # Create system tray icon (non-blocking, continue even if it fails)
+        # Create system tray icon on its own thread: importing pystray/PIL, decoding the
+        # icon and building the menu all happen off the path to the first window.
         # NOTE: On macOS, pystray can conflict with pywebview's event loop
         # Skip tray icon on macOS for now
-        if platform.system() != 'Darwin':
-            try:
-                self.create_tray_icon()
-            except Exception as e:
-                print(f"Warning: Could not create tray icon: {e}")
-                print("Application will continue without tray icon.")
+        if sys.platform != 'darwin':
+            threading.Thread(target=self.create_tray_icon, name='tray', daemon=True).start()
         else:
-            print("Note: Tray icon disabled on macOS (conflicts with pywebview event loop)")
+            log.info("Tray icon disabled on macOS (conflicts with pywebview event loop)")
+        
+        threading.Thread(target=self._warm_imports, name='import-warmup', daemon=True).start()
+        # Handshake with the configured servers while the window loads
+        self.api.warm_connections()
         
         # Find the home HTML file - check multiple options in order:
         # 1. Built version (dist/home.html) - preferred
         # 2. Vite dev server (http://localhost:1420/home.html) - for development
         # 3. Error if neither available
         
-        home_html = self.project_root / 'dist' / 'home.html'
-        using_built = home_html.exists()
+        home_html, home_url, _, _ = self._html_paths['home']
+        using_built = home_url is not None
         using_vite_dev = False
         html_path = None
         
         if using_built:
-            print("Found built version in dist/home.html")
+            log.info("Found built version in dist/home.html")
             # Start local HTTP server for built assets
             if self.start_local_server(self.project_root / 'dist', self.http_port):
-                html_path = f"http://localhost:{self.http_port}/home.html"
-                print(f"Using HTTP server: {html_path}")
+                html_path = home_url
+                log.info("Using HTTP server: %s", html_path)
             else:
                 html_path = str(home_html.resolve())
         else:
             # Check if Vite dev server is running
-            import urllib.request
-            try:
-                response = urllib.request.urlopen('http://localhost:1420/home.html', timeout=1)
-                response.close()
-                html_path = 'http://localhost:1420/home.html'
+            html_path = self.find_vite_dev_server()
+            if html_path:
                 using_vite_dev = True
-                print("Found Vite dev server running on port 1420")
-                print(f"Using Vite dev server: {html_path}")
-            except:
-                # Vite dev server not running
-                pass
+                log.info("Found Vite dev server running on port 1420, using %s", html_path)
         
         # If neither built version nor Vite dev server available, show error
         if not html_path:
@@ -316,7 +409,7 @@ Then restart this application.
 Searched locations:
   - {self.project_root / 'dist' / 'home.html'}
   - Vite dev server: http://localhost:1420/home.html"""
-            print(error_msg)
+            log.error(error_msg)
             # On Mac, show a simple error window if possible
             try:
                 error_window = webview.create_window(
@@ -348,63 +441,52 @@ Searched locations:
                 )
                 webview.start(debug=False)
             except:
-                # If even error window fails, print and exit
-                print("Could not create error window. Exiting.")
+                # If even error window fails, log and exit
+                log.error("Could not create error window. Exiting.")
                 sys.exit(1)
             return
         
-        print(f"Loading: {html_path}")
+        log.info("Loading: %s", html_path)
         
         # On macOS, PyWebView works better when window is created before start()
         # but we need to ensure it's properly shown
         try:
             # Create window - use URL string directly (PyWebView handles http:// and file://)
-            main_window = webview.create_window(
-                'PLATONIC - Pantheon Lab Tools Orchestration for Integration and Control',
+            main_window = self._open_window(
+                'home',
                 html_path,  # Can be http:// URL or file:// path
-                width=1280,
-                height=740,
-                resizable=True,
-                hidden=False,  # Show the home dashboard window
-                js_api=self.api,  # Expose API to JavaScript as window.pywebview.api
                 text_select=False,  # Prevent text selection issues
                 shadow=True  # Enable window shadow on Mac
             )
-            self.windows['home'] = main_window
             
-            # Set up error handler to prevent window from closing on JS errors
+            # The JS error handlers that keep the window open live in an inline script
+            # in src/home.html, so they're installed before any module code runs
             def on_loaded():
                 """Called when window finishes loading"""
-                print("Window loaded successfully")
-                try:
-                    # Inject error handler to catch JS errors and prevent window closure
-                    main_window.evaluate_js("""
-                        window.addEventListener('error', function(e) {
-                            console.error('JavaScript error:', e.error);
-                            // Don't let errors close the window
-                            e.preventDefault();
-                        });
-                        window.addEventListener('unhandledrejection', function(e) {
-                            console.error('Unhandled promise rejection:', e.reason);
-                            e.preventDefault();
-                        });
-                    """)
-                except Exception as e:
-                    print(f"Could not inject error handler: {e}")
+                log.info("Window loaded successfully")
             
             main_window.events.loaded += on_loaded
             
-            print(f"Window created successfully. Platform: {platform.system()}")
-            print(f"Loading: {html_path}")
-            print("Starting webview...")
+            # Once the dashboard is up, build the Settings window hidden: creating a webview
+            # (WebView2 controller on Windows) takes seconds, so pay it before the first click.
+            # Status isn't prewarmed because its page polls servers while open.
+            def prewarm_settings():
+                if not prewarm_once.is_set():
+                    prewarm_once.set()
+                    self._prewarm_window('settings')
+            
+            prewarm_once = threading.Event()
+            
+            main_window.events.loaded += prewarm_settings
+            
+            log.info("Window created successfully. Platform: %s. Starting webview...", sys.platform)
             # Start webview (this blocks)
             # Enable debug mode on Mac to see console errors
-            webview.start(debug=platform.system() == 'Darwin')
+            webview.start(debug=sys.platform == 'darwin')
         except Exception as e:
-            error_msg = f"Failed to start application: {e}"
-            print(error_msg)
             import traceback
-            traceback.print_exc()
+            log.exception("Failed to start application: %s", e)
+            error_msg = f"Failed to start application: {e}"
             
             # Try to show error in a window
             try:
@@ -417,15 +499,14 @@ Searched locations:
                 )
                 webview.start(debug=False)
             except:
-                print("Could not create error window. Exiting.")
+                log.error("Could not create error window. Exiting.")
                 sys.exit(1)
 
 
 def main():
     """Main entry point"""
     # Set up logging
-    import logging
-    logging.basicConfig(level=logging.INFO)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(name)s %(message)s')
     
     # Create and run app
     app = OrchestratorApp()
@@ -1,29 +1,117 @@
 """Process manager for launching and managing local applications"""
 import subprocess
+import functools
+import hashlib
+import logging
 import os
+import select
+import shlex
 import sys
+import threading
 from typing import Dict, Optional
 from config import LocalAppConfig
 
+log = logging.getLogger(__name__)
+
+
+def _shell_quote(arg: str) -> str:
+    """Quote one argument for the platform's shell (cmd.exe or sh)"""
+    if sys.platform == 'win32':
+        return subprocess.list2cmdline([arg])
+    return shlex.quote(arg)
+
+
+@functools.lru_cache(maxsize=1)
+def _conda_base() -> Optional[str]:
+    """`conda info --base`, run once per process (None if conda can't be run from here)"""
+    try:
+        return subprocess.check_output(['conda', 'info', '--base'], text=True, timeout=30).strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _app_path(working_directory: Optional[str], path: str, absolute: bool = False) -> str:
+    """Resolve an app-relative path against its working directory (cached per config value)"""
+    if working_directory and not os.path.isabs(path):
+        path = os.path.join(working_directory, path)
+    return os.path.abspath(path) if absolute else path
+
+
+_REQ_MARKER_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'orchestrator')
+
+
+def _requirements_digest(req_path: str, conda_env: str) -> Optional[str]:
+    """Content hash of a requirements file for one env (None if it can't be read)"""
+    try:
+        with open(req_path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    return hashlib.blake2b(data, digest_size=16, person=conda_env.encode()[:16]).hexdigest()
+
+
+def _requirements_installed(marker: str, digest: str) -> bool:
+    """Whether the marker records a successful install of exactly this digest"""
+    try:
+        with open(marker) as f:
+            return f.read().strip() == digest
+    except OSError:
+        return False
+
+
+def _wait_exit(process: subprocess.Popen, timeout: float) -> None:
+    """Popen.wait(timeout), but sleeping on a pidfd where Linux provides one
+    
+    With a timeout, Popen.wait polls waitpid with growing sleeps (and spins on its
+    lock while our watcher thread is blocked reaping the same child); a pidfd
+    becomes readable the moment the process exits.
+    """
+    if not hasattr(os, 'pidfd_open') or process.returncode is not None:
+        process.wait(timeout=timeout)
+        return
+    try:
+        fd = os.pidfd_open(process.pid)
+    except OSError:
+        # Already reaped (ESRCH) or pidfds unsupported by this kernel
+        process.wait(timeout=timeout)
+        return
+    try:
+        poller = select.poll()
+        poller.register(fd, select.POLLIN)
+        if not poller.poll(timeout * 1000):
+            raise subprocess.TimeoutExpired(process.args, timeout)
+    finally:
+        os.close(fd)
+    # Exited; returns once the child is reaped (here or by the watcher thread)
+    process.wait()
+
 
 class ProcessManager:
     """Manages local application processes"""
     
     def __init__(self):
         self.processes: Dict[str, subprocess.Popen] = {}
+        self._lock = threading.Lock()  # Guards every access to self.processes
     
     def launch_app(self, config: LocalAppConfig) -> None:
-        """Launch a local application"""
+        """Launch a local application
+        
+        Children inherit our stdout/stderr (or get their own console on Windows).
+        Never pass stdout/stderr=PIPE here: nothing reads those pipes, so a chatty
+        app would block once the pipe buffer fills.
+        """
         # Check if already running
-        if config.id in self.processes:
-            process = self.processes[config.id]
-            if process.poll() is None:  # Still running
-                print(f"App '{config.name}' is already running (PID: {process.pid})")
-                raise Exception(f"App '{config.name}' is already running")
-            else:
-                # Process has exited, remove it
-                print(f"Previous process for '{config.name}' has exited, cleaning up...")
-                del self.processes[config.id]
+        with self._lock:
+            process = self.processes.get(config.id)
+            if process is not None:
+                if process.poll() is None:  # Still running
+                    log.info("App '%s' is already running (PID: %s)", config.name, process.pid)
+                    raise Exception(f"App '{config.name}' is already running")
+                else:
+                    # Process has exited, remove it
+                    log.info("Previous process for '%s' has exited, cleaning up...", config.name)
+                    self.processes.pop(config.id, None)
         
         try:
             if config.use_shell:
@@ -32,32 +120,46 @@ class ProcessManager:
                     # Use custom shell command
                     shell_cmd = config.shell_command
                 elif config.conda_env:
-                    # Build conda activation command
-                    conda_base = "conda" if sys.platform == 'win32' else "source $(conda info --base)/etc/profile.d/conda.sh && conda"
-                    
                     # Build command parts
                     cmd_parts = []
                     
                     if sys.platform == 'win32':
                         cmd_parts.append(f"conda activate {config.conda_env}")
                     else:
-                        cmd_parts.append(f"source $(conda info --base)/etc/profile.d/conda.sh")
+                        # Resolve conda's base once instead of spawning conda on every launch;
+                        # fall back to letting the shell ask if conda isn't on our PATH
+                        base = _conda_base()
+                        if base:
+                            cmd_parts.append(f"source {shlex.quote(base + '/etc/profile.d/conda.sh')}")
+                        else:
+                            cmd_parts.append(f"source $(conda info --base)/etc/profile.d/conda.sh")
                         cmd_parts.append(f"conda activate {config.conda_env}")
                     
                     # Install dependencies if requested
                     if config.install_dependencies and config.requirements_file:
-                        req_path = config.requirements_file
-                        if config.working_directory and not os.path.isabs(req_path):
-                            req_path = os.path.join(config.working_directory, req_path)
                         # Use absolute path for requirements file
-                        req_path = os.path.abspath(req_path)
-                        cmd_parts.append(f"pip install -r \"{req_path}\"")
+                        req_path = _app_path(config.working_directory, config.requirements_file, absolute=True)
+                        digest = _requirements_digest(req_path, config.conda_env)
+                        marker = os.path.join(_REQ_MARKER_DIR, f"{config.id}.reqhash")
+                        if digest and _requirements_installed(marker, digest):
+                            log.info("Requirements for '%s' unchanged, skipping pip install", config.name)
+                        else:
+                            cmd_parts.append(
+                                f"pip install --disable-pip-version-check --no-input -r {_shell_quote(req_path)}"
+                            )
+                            if digest:
+                                # Only recorded once pip has succeeded (the chain stops at the first failure)
+                                os.makedirs(_REQ_MARKER_DIR, exist_ok=True)
+                                cmd_parts.append(f"echo {digest}> {_shell_quote(marker)}")
                     
                     # Run the Python script
-                    exec_path = config.executable_path
-                    if config.working_directory and not os.path.isabs(exec_path):
-                        exec_path = os.path.join(config.working_directory, exec_path)
-                    cmd_parts.append(f"python {exec_path}")
+                    exec_path = _app_path(config.working_directory, config.executable_path)
+                    run_script = f"python {_shell_quote(exec_path)}"
+                    if sys.platform != 'win32':
+                        # exec: sh replaces itself with python instead of waiting on it,
+                        # so there's no idle shell left over and terminate() signals the app itself
+                        run_script = f"exec {run_script}"
+                    cmd_parts.append(run_script)
                     
                     shell_cmd = " && ".join(cmd_parts)
                 else:
@@ -89,42 +191,52 @@ class ProcessManager:
                     cwd=config.working_directory
                 )
             
-            self.processes[config.id] = process
-            print(f"Launched app: {config.name} (PID: {process.pid})")
+            with self._lock:
+                self.processes[config.id] = process
+            log.info("Launched app: %s (PID: %s)", config.name, process.pid)
+            
+            # Blocks in wait() until the app exits, so status checks never poll
+            threading.Thread(
+                target=self._watch, args=(config.id, process),
+                name=f'watch-{config.id}', daemon=True
+            ).start()
             
         except Exception as e:
             raise Exception(f"Failed to launch app '{config.name}': {e}")
     
+    def _watch(self, app_id: str, process: subprocess.Popen) -> None:
+        """Forget an app as soon as its process exits (runs on a per-app watcher thread)"""
+        process.wait()
+        with self._lock:
+            # A relaunch may already have replaced this entry
+            if self.processes.get(app_id) is process:
+                del self.processes[app_id]
+    
     def is_running(self, app_id: str) -> bool:
-        """Check if an app is currently running"""
-        if app_id not in self.processes:
-            return False
-        
-        process = self.processes[app_id]
-        if process.poll() is None:
-            return True
-        else:
-            # Process has exited
-            del self.processes[app_id]
-            return False
+        """Check if an app is currently running (exited apps are removed by their watcher)"""
+        with self._lock:
+            return app_id in self.processes
     
     def terminate(self, app_id: str) -> None:
         """Terminate a running app"""
-        if app_id not in self.processes:
+        with self._lock:
+            process = self.processes.pop(app_id, None)
+        if process is None:
             return
         
-        process = self.processes[app_id]
         try:
             process.terminate()
-            process.wait(timeout=5)
+            _wait_exit(process, timeout=5)
         except subprocess.TimeoutExpired:
             process.kill()
-        finally:
-            del self.processes[app_id]
     
     def cleanup_all(self) -> None:
         """Terminate all running processes"""
-        for app_id in list(self.processes.keys()):
+        while True:
+            with self._lock:
+                if not self.processes:
+                    break
+                app_id = next(iter(self.processes))
             try:
                 self.terminate(app_id)
             except:
@@ -1,11 +1,27 @@
 """SSH client for remote Docker operations using paramiko"""
+import functools
 import json
 import paramiko
 import logging
-from typing import List, Dict, Optional
+import os
+import select
+import socket
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Dict, Optional, Tuple
 from dataclasses import dataclass
+from config import AppConfig
 
+try:
+    import orjson  # Optional: faster parsing of `docker compose ps` output
+except ImportError:
+    orjson = None
+
+# Keep paramiko's per-packet/per-channel DEBUG records off even if the app logs at
+# DEBUG. transport is pinned too: channels log through it, on every exec.
 logging.getLogger('paramiko').setLevel(logging.WARNING)
+logging.getLogger('paramiko.transport').setLevel(logging.WARNING)
 
 @dataclass
 class ContainerStatus:
@@ -13,70 +29,260 @@ class ContainerStatus:
     name: str
     status: str
     state: str
+    
+    def as_dict(self) -> Dict[str, str]:
+        """Plain dict for the frontend (explicit fields; dataclasses.asdict deep-copies reflectively)"""
+        return {'name': self.name, 'status': self.status, 'state': self.state}
+
+
+def _parse_compose_ps(output: str) -> List[ContainerStatus]:
+    """Parse `docker compose ps --format json` output into ContainerStatus objects"""
+    loads = orjson.loads if orjson is not None else json.loads
+    # Records are objects (or, from old compose, one array); noise such as warnings and
+    # error messages never starts with { or [, so it's dropped without a parse attempt
+    lines = [line for line in output.split('\n') if line.lstrip()[:1] in ('{', '[')]
+    try:
+        # Parse every record in one call
+        entries = loads('[' + ','.join(lines) + ']')
+    except ValueError:
+        # A malformed record; parse line by line and skip the bad ones
+        entries = []
+        for line in lines:
+            try:
+                entries.append(loads(line))
+            except ValueError:
+                continue
+    
+    containers = []
+    for parsed in entries:
+        # Older compose versions print a single JSON array instead of one object per line
+        for container in (parsed if isinstance(parsed, list) else [parsed]):
+            containers.append(ContainerStatus(
+                name=container.get('Name', ''),
+                status=container.get('Status', ''),
+                state=container.get('State', '')
+            ))
+    return containers
+
+
+# Parsed private keys by path, reused across connects while the file is unchanged:
+# path -> ((mtime_ns, size), PKey)
+_KEY_CACHE: Dict[str, Tuple[Tuple[int, int], paramiko.PKey]] = {}
+_KEY_CACHE_LOCK = threading.Lock()
+
+
+def _load_private_key(path: str) -> paramiko.PKey:
+    """Parse a private key file (any type paramiko supports), cached per path"""
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _KEY_CACHE_LOCK:
+        cached = _KEY_CACHE.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+    key = paramiko.PKey.from_path(path)
+    with _KEY_CACHE_LOCK:
+        _KEY_CACHE[path] = (stamp, key)
+    return key
+
+
+@functools.lru_cache(maxsize=1)
+def _known_hosts_path() -> str:
+    """Host keys accepted so far, kept next to the config file (created on first use)"""
+    path = AppConfig.get_config_path().parent / 'known_hosts'
+    path.touch(exist_ok=True)
+    return str(path)
+
+
+# Serializes known_hosts reads and rewrites across every SSHClient in the process
+_KNOWN_HOSTS_LOCK = threading.Lock()
+
+
+class _RecordNewHostKey(paramiko.MissingHostKeyPolicy):
+    """AutoAddPolicy, but merging into the shared known_hosts file under a lock
+    
+    AutoAddPolicy saves the client's own copy of the file, so concurrent first
+    connects (warm_connections at startup) would overwrite each other's entries.
+    """
+    
+    def missing_host_key(self, client, hostname, key):
+        with _KNOWN_HOSTS_LOCK:
+            # Re-read so keys other clients recorded since we loaded are kept
+            host_keys = paramiko.HostKeys(_known_hosts_path())
+            host_keys.add(hostname, key.get_name(), key)
+            host_keys.save(_known_hosts_path())
+        client.get_host_keys().add(hostname, key.get_name(), key)
+
+
+# Seconds between SSH keepalive packets on idle connections
+_KEEPALIVE_INTERVAL = 30
+
+# Concurrent sessions opened per connection; OpenSSH's default MaxSessions is 10,
+# leave headroom for long-lived log streams
+_MAX_SESSIONS = 8
+
+# Section markers framing each service's output in bulk_service_status
+_PS_MARKER = '__ORCH_PS__'
+_HEALTH_MARKER = '__ORCH_HEALTH__'
+
+# Printed by start_service_and_wait when the service started but never turned healthy
+_UNHEALTHY_MARKER = '__ORCH_UNHEALTHY__'
+
+
+def _health_wait_script(port: int, path: str, max_wait: int, initial_interval: int, max_interval: int) -> str:
+    """Remote poll loop that exits 0 once a service returns 200, or 1 after max_wait seconds
+    
+    Intervals are rounded to whole seconds (at least 1): POSIX sleep only takes
+    integers, and busybox or strict shells reject fractions.
+    """
+    probe = f"[ \"$(curl -s -o /dev/null -w '%{{http_code}}' --max-time 2 http://localhost:{port}{path})\" = 200 ]"
+    max_interval = max(1, round(max_interval))
+    # Escalating sleeps are spelled out, then max_interval repeats
+    escalation = []
+    interval = max(1, round(initial_interval))
+    while interval < max_interval:
+        escalation.append(str(interval))
+        interval *= 2
+    check = f"{probe} && exit 0; [ $(date +%s) -ge $end ] && exit 1"
+    return (
+        f"end=$(($(date +%s) + {int(max_wait)})); "
+        f"for d in {' '.join(escalation)}; do {check}; sleep $d; done; "
+        f"while :; do {check}; sleep {max_interval}; done"
+    )
+
+
+def _drain(channel: paramiko.Channel, timeout: float) -> Tuple[bytes, bytes, int]:
+    """Read stdout and stderr together until the command exits; returns (stdout, stderr, exit status)
+    
+    Reading one stream to EOF before the other can stall: both share the channel's
+    flow-control window, so unread stderr can hold up stdout. Raises socket.timeout
+    after `timeout` seconds without any output.
+    """
+    out = bytearray()
+    err = bytearray()
+    while True:
+        if channel.recv_ready():
+            out += channel.recv(32768)
+        elif channel.recv_stderr_ready():
+            err += channel.recv_stderr(32768)
+        elif channel.exit_status_ready():
+            # Exit status is sent after the command's output, so both buffers are complete
+            return bytes(out), bytes(err), channel.recv_exit_status()
+        elif not select.select([channel], [], [], timeout)[0]:
+            raise socket.timeout(f"No output for {timeout}s")
 
 
 class SSHClient:
     """SSH client for connecting to remote servers and executing commands"""
     
-    def __init__(self, host: str, port: int, username: str, ssh_key_path: str, portal_path: str = ""):
+    def __init__(self, host: str, port: int, username: str, ssh_key_path: str, portal_path: str = "",
+                 compression: bool = True):
         self.host = host
         self.port = port
         self.username = username
         self.ssh_key_path = ssh_key_path
         self.portal_path = portal_path  # Kept for backward compatibility
+        # zlib on the transport: log and `docker compose ps` output compress several-fold,
+        # and the CPU cost is negligible at these sizes. Turn off for fast LANs.
+        self.compression = compression
         self.client = None
+        self._session_slots = threading.BoundedSemaphore(_MAX_SESSIONS)
+        self._reconnect_lock = threading.Lock()
     
     def connect(self) -> None:
-        """Establish SSH connection"""
+        """Establish SSH connection
+        
+        Every handshake phase is bounded so a misconfigured host fails within seconds
+        instead of hanging the caller. Servers that stall several seconds before auth
+        usually do a reverse DNS lookup per login: set `UseDNS no` in their sshd_config.
+        """
         try:
             self.client = paramiko.SSHClient()
-            self.client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            # Trust on first use: new host keys are recorded in known_hosts, a changed one is refused
+            with _KNOWN_HOSTS_LOCK:
+                self.client.get_host_keys().load(_known_hosts_path())
+            self.client.set_missing_host_key_policy(_RecordNewHostKey())
             
-            # Check if key file exists
-            import os
-            if not os.path.exists(self.ssh_key_path):
+            # Parsed once and reused by later connects (pool refills, reconnects); the
+            # cache's stat doubles as the existence check
+            try:
+                pkey = _load_private_key(self.ssh_key_path)
+            except FileNotFoundError:
                 raise Exception(f"SSH key not found at path: {self.ssh_key_path}\nPlease check the file exists and the path is correct.")
             
-            # Read key file to check format
-            with open(self.ssh_key_path, 'r') as f:
-                key_content = f.read()
-            
-            # Log key format (paramiko handles OpenSSH format natively!)
-            if "BEGIN OPENSSH PRIVATE KEY" in key_content:
-                print("Note: Detected OpenSSH format key (ED25519 supported by paramiko)")
-            elif "BEGIN RSA PRIVATE KEY" in key_content or "BEGIN EC PRIVATE KEY" in key_content:
-                print("Note: Detected PEM format key")
-            
             # Connect using private key (paramiko supports OpenSSH format including ED25519)
             self.client.connect(
                 hostname=self.host,
                 port=self.port,
                 username=self.username,
-                key_filename=self.ssh_key_path,
+                pkey=pkey,
                 timeout=10,
+                banner_timeout=10,
+                auth_timeout=10,
+                channel_timeout=10,
                 look_for_keys=False,  # Only use the specified key
-                allow_agent=False
+                allow_agent=False,
+                compress=self.compression  # Negotiated during the handshake; falls back if the server refuses
             )
+            # Keepalives stop NAT/firewall idle timeouts from silently killing pooled connections
+            self.client.get_transport().set_keepalive(_KEEPALIVE_INTERVAL)
             print(f"Successfully connected to {self.username}@{self.host}:{self.port}")
             
         except paramiko.AuthenticationException as e:
             raise Exception(f"SSH authentication failed: {e}\nUsername: {self.username}\nKey: {self.ssh_key_path}")
+        except paramiko.BadHostKeyException as e:
+            raise Exception(f"SSH host key for {self.host} has changed: {e}\n"
+                            f"If the server was reinstalled, remove its entry from {_known_hosts_path()}")
         except paramiko.SSHException as e:
             raise Exception(f"SSH connection failed: {e}")
         except Exception as e:
             raise Exception(f"Failed to connect to {self.host}:{self.port}: {e}")
     
-    def execute_command(self, cmd: str) -> str:
+    def get_channel(self) -> paramiko.Channel:
+        """Open a new session channel on the connection's transport
+        
+        Reconnects first if the transport has died; a ChannelException on a dead
+        transport is retried once on a fresh connection.
+        """
+        if not self.client:
+            raise Exception("Not connected to SSH server")
+        
+        transport = self._live_transport()
+        try:
+            return transport.open_session()
+        except paramiko.ChannelException:
+            if transport.is_active():
+                raise  # Server refused the session (e.g. MaxSessions) - reconnecting won't help
+            return self._live_transport().open_session()
+    
+    def _live_transport(self) -> paramiko.Transport:
+        """Return an active transport, reconnecting if the current one is gone"""
+        with self._reconnect_lock:
+            transport = self.client.get_transport() if self.client else None
+            if transport is None or not transport.is_active():
+                print(f"SSH transport to {self.host}:{self.port} is no longer active, reconnecting")
+                self.disconnect()
+                self.connect()
+                transport = self.client.get_transport()
+            return transport
+    
+    def execute_command(self, cmd: str, timeout: float = 30) -> str:
         """Execute a command on the remote server"""
         if not self.client:
             raise Exception("Not connected to SSH server")
         
         try:
-            stdin, stdout, stderr = self.client.exec_command(cmd, timeout=30)
-            exit_status = stdout.channel.recv_exit_status()
+            # One session channel per command on the shared transport - no new handshake
+            with self._session_slots:
+                channel = self.get_channel()
+                try:
+                    channel.exec_command(cmd)
+                    channel.shutdown_write()  # Nothing is sent on stdin
+                    out, err, exit_status = _drain(channel, timeout)
+                finally:
+                    channel.close()
             
-            output = stdout.read().decode('utf-8')
-            error = stderr.read().decode('utf-8')
+            output = out.decode('utf-8')
+            error = err.decode('utf-8')
             
             if exit_status != 0:
                 raise Exception(f"Command failed with exit status {exit_status}: {error or output}")
@@ -85,60 +291,118 @@ class SSHClient:
         except Exception as e:
             raise Exception(f"Failed to execute command '{cmd}': {e}")
     
-    def check_containers(self) -> List[ContainerStatus]:
-        """Check Docker containers status (uses portal_path for backward compatibility)"""
-        return self.check_containers_at_path(self.portal_path)
+    def stream_command(self, cmd: str, chunk_size: int = 32768, timeout: float = 30) -> Iterator[bytes]:
+        """Run a command and yield its output (stderr merged in) in chunks as it arrives
+        
+        Raises after the last chunk if the command exits non-zero, like execute_command.
+        """
+        with self._session_slots:
+            channel = self.get_channel()
+            try:
+                channel.set_combine_stderr(True)
+                channel.settimeout(timeout)
+                channel.exec_command(cmd)
+                last = b''
+                while True:
+                    data = channel.recv(chunk_size)
+                    if not data:
+                        break
+                    last = data
+                    yield data
+                exit_status = channel.recv_exit_status()
+            finally:
+                channel.close()
+        
+        if exit_status != 0:
+            error = last.decode('utf-8', errors='replace').strip()
+            raise Exception(f"Command failed with exit status {exit_status}: {error}")
     
-    def check_containers_at_path(self, path: str) -> List[ContainerStatus]:
-        """Check Docker containers status at a specific path"""
-        # Combine path and compose file checks into one command for speed
-        try:
-            # Single combined check: path exists AND compose file exists
-            combined_check = f"test -d {path} && (test -f {path}/docker-compose.yml || test -f {path}/docker-compose.yaml) && echo 'ok' || echo 'fail'"
-            check_result = self.execute_command(combined_check).strip()
-            
-            if check_result != 'ok':
-                print(f"Warning: Path does not exist or no docker-compose file found at {path}")
-                return []
-        except Exception as e:
-            print(f"Warning: Could not verify path {path}: {e}")
-            # Continue anyway - docker compose will fail with a clearer error
+    @contextmanager
+    def open_stream(self, cmd: str, timeout: float = 1.0) -> Iterator[paramiko.Channel]:
+        """Start a long-running command and yield its channel for incremental reads
         
-        # Try to get containers
-        try:
-            cmd = f"cd {path} && docker compose ps --format json 2>&1"
-            output = self.execute_command(cmd)
-            
-            containers = []
-            for line in output.strip().split('\n'):
-                if not line or line.strip() == '':
-                    continue
-                try:
-                    container = json.loads(line)
-                    containers.append(ContainerStatus(
-                        name=container.get('Name', ''),
-                        status=container.get('Status', ''),
-                        state=container.get('State', '')
-                    ))
-                except json.JSONDecodeError:
-                    # Skip non-JSON lines (like error messages)
-                    continue
-            
-            return containers
-        except Exception as e:
-            error_msg = str(e)
-            # Check if it's a "no configuration file" error
-            if 'no configuration file' in error_msg.lower() or 'not found' in error_msg.lower():
-                print(f"Error: No docker-compose.yml found at {path}")
-                print(f"This usually means:")
-                print(f"  1. The path '{path}' is incorrect")
-                print(f"  2. The docker-compose.yml file doesn't exist at that location")
-                print(f"  3. The file might be named differently (docker-compose.yaml)")
-                print(f"Please check the path in Settings and ensure docker-compose.yml exists.")
-                # Return empty list instead of failing - allows graceful handling
-                return []
-            # For other errors, re-raise
-            raise
+        stderr is merged into stdout; recv() raises socket.timeout after `timeout`
+        seconds without output so readers can check a stop flag. The channel holds one
+        of the connection's session slots until the block exits, which closes it.
+        """
+        with self._session_slots:
+            channel = self.get_channel()
+            try:
+                channel.set_combine_stderr(True)
+                channel.settimeout(timeout)
+                channel.exec_command(cmd)
+                yield channel
+            finally:
+                channel.close()
+    
+    def bulk_service_status(self, services: List[Any]) -> List[Tuple[List[ContainerStatus], bool]]:
+        """Check containers and health for several services with a single remote command
+        
+        Each service needs `path`, `port` and `healthcheck_path` attributes.
+        Returns (containers, healthy) per service, in input order.
+        """
+        if not services:
+            return []
+        
+        # One script, one exec; each section of output is framed by a marker line.
+        # Per-call nonce so no line of docker/curl output can be mistaken for a marker
+        nonce = uuid.uuid4().hex[:12]
+        ps_marker = f"{_PS_MARKER}{nonce}"
+        health_marker = f"{_HEALTH_MARKER}{nonce}"
+        
+        # Services sharing a compose file share one `docker compose ps`
+        paths: List[str] = []
+        path_index: Dict[str, int] = {}
+        for service in services:
+            if service.path not in path_index:
+                path_index[service.path] = len(paths)
+                paths.append(service.path)
+        
+        # Every probe runs concurrently in a background subshell writing to its
+        # own temp file; the files are then printed in order
+        probes = []
+        for idx, path in enumerate(paths):
+            probes.append(
+                f"echo '{ps_marker} {idx}'; "
+                f"(test -f {path}/docker-compose.yml || test -f {path}/docker-compose.yaml) "
+                f"&& (cd {path} && docker compose ps --format json 2>/dev/null); echo"
+            )
+        for idx, service in enumerate(services):
+            probes.append(
+                f"echo '{health_marker} {idx}'; "
+                f"curl -s -o /dev/null -w '%{{http_code}}' --max-time 2 "
+                f"http://localhost:{service.port}{service.healthcheck_path} || echo '000'; echo"
+            )
+        script_lines = ['d=$(mktemp -d) || exit 1']
+        for n, probe in enumerate(probes):
+            script_lines.append(f"( {probe} ) > $d/{n} 2>/dev/null &")
+        script_lines.append('wait')
+        script_lines.append(f"for i in $(seq 0 {len(probes) - 1}); do cat $d/$i 2>/dev/null; done")
+        script_lines.append('rm -rf $d')
+        output = self.execute_command("\n".join(script_lines))
+        
+        # Split the combined output back into per-path / per-service sections
+        ps_output: Dict[int, List[str]] = {}
+        health_output: Dict[int, List[str]] = {}
+        current = None
+        for line in output.split('\n'):
+            if line.startswith(ps_marker) or line.startswith(health_marker):
+                marker, _, idx = line.partition(' ')
+                target = ps_output if marker == ps_marker else health_output
+                current = target.setdefault(int(idx), [])
+            elif current is not None:
+                current.append(line)
+        
+        containers_by_path = [
+            _parse_compose_ps('\n'.join(ps_output.get(idx, []))) for idx in range(len(paths))
+        ]
+        results = []
+        for idx, service in enumerate(services):
+            # curl prints the code without a newline, then "000" on failure
+            health = ''.join(health_output.get(idx, [])).strip()
+            # Services on the same path get the same list (treat as read-only)
+            results.append((containers_by_path[path_index[service.path]], health.startswith('200')))
+        return results
     
     def start_portal(self) -> None:
         """Start the portal Docker containers (deprecated, use start_service)"""
@@ -150,18 +414,39 @@ class SSHClient:
     
     def start_service(self, path: str, service_name: Optional[str] = None, pre_launch_command: Optional[str] = None) -> None:
         """Start a Docker service at a specific path"""
-        # Run pre-launch command if specified (e.g., for setup, env file creation)
-        if pre_launch_command:
-            print(f"Running pre-launch command: {pre_launch_command}")
-            pre_cmd = f"cd {path} && {pre_launch_command}"
-            self.execute_command(pre_cmd)
+        self.execute_command(self._start_command(path, service_name, pre_launch_command))
+    
+    def start_service_and_wait(self, path: str, service_name: Optional[str], pre_launch_command: Optional[str],
+                               port: int, health_path: str = "/", max_wait: int = 120,
+                               initial_interval: int = 1, max_interval: int = 4) -> bool:
+        """start_service, then wait on the remote side until the service returns 200, in a single exec
         
-        # Start the service
+        The poll loop runs in the remote shell: it probes immediately, then backs off
+        from initial_interval, doubling up to max_interval. Raises if the start fails;
+        returns False if the service started but wasn't healthy within max_wait seconds.
+        """
+        start = self._start_command(path, service_name, pre_launch_command)
+        wait = _health_wait_script(port, health_path, max_wait, initial_interval, max_interval)
+        # The wait runs in a subshell so a timeout reports through the marker, not the exit status
+        cmd = f"{start} && {{ ( {wait} ) || echo '{_UNHEALTHY_MARKER}'; }}"
+        # Start phase gets the usual 30s, plus the wait's own allowance
+        output = self.execute_command(cmd, timeout=30 + max_wait + max_interval + 15)
+        return _UNHEALTHY_MARKER not in output
+    
+    @staticmethod
+    def _start_command(path: str, service_name: Optional[str], pre_launch_command: Optional[str]) -> str:
+        """Shell command that starts a compose project (or one of its services)"""
         if service_name:
             cmd = f"cd {path} && docker compose up -d {service_name}"
         else:
             cmd = f"cd {path} && docker compose up -d"
-        self.execute_command(cmd)
+        
+        # Run pre-launch command if specified (e.g., for setup, env file creation),
+        # chained into the same exec; a failing pre-launch command still aborts the start
+        if pre_launch_command:
+            print(f"Running pre-launch command: {pre_launch_command}")
+            cmd = f"cd {path} && ({pre_launch_command}) && {cmd}"
+        return cmd
     
     def stop_service(self, path: str, service_name: Optional[str] = None) -> None:
         """Stop a Docker service at a specific path"""
@@ -185,21 +470,19 @@ class SSHClient:
             cmd = f"cd {self.portal_path} && docker compose logs --tail {lines}"
         return self.execute_command(cmd)
     
-    def check_portal_health(self, port: int) -> bool:
-        """Check if the portal is responding (deprecated, use check_service_health)"""
-        return self.check_service_health(port, "/")
-    
-    def check_service_health(self, port: int, path: str = "/") -> bool:
-        """Check if a service is responding at a specific port and path"""
-        # Add --max-time 2 to limit health check to 2 seconds (prevents hanging)
-        cmd = f"curl -s -o /dev/null -w '%{{http_code}}' --max-time 2 http://localhost:{port}{path} || echo '000'"
+    def is_alive(self) -> bool:
+        """Check that the connection is still usable (sends an SSH ignore packet)"""
+        if not self.client:
+            return False
+        transport = self.client.get_transport()
+        if transport is None or not transport.is_active():
+            return False
         try:
-            output = self.execute_command(cmd)
-            status_code = output.strip()
-            return status_code == "200"
-        except:
+            transport.send_ignore()
+            return True
+        except Exception:
             return False
-    
+
     def disconnect(self) -> None:
         """Close SSH connection"""
         if self.client:
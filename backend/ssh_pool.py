@@ -0,0 +1,172 @@
+"""Persistent SSH connection pool shared by API calls"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, ContextManager, Dict, Iterator, Optional, Tuple
+from ssh_client import SSHClient
+
+# (host, port, username, ssh_key_path)
+PoolKey = Tuple[str, int, str, str]
+
+
+class _PooledConnection:
+    """A live SSHClient plus bookkeeping for the pool"""
+
+    def __init__(self, ssh: SSHClient):
+        self.ssh = ssh
+        self.users = 0
+        self.last_used = time.monotonic()
+        # Last time the connection was known good (connected or a call succeeded)
+        self.verified = self.last_used
+        # Replaced in the pool by a fresh connection; closed once the last user is done
+        self.retired = False
+
+
+class SSHPool:
+    """Keeps authenticated SSH connections open and hands them out per call.
+
+    paramiko opens a new channel for every exec_command on a shared transport,
+    so a single connection per key can serve concurrent callers. Connections
+    idle for longer than idle_timeout are closed by a background reaper.
+    """
+
+    def __init__(self, idle_timeout: float = 300.0, reap_interval: float = 60.0):
+        self.idle_timeout = idle_timeout
+        self.reap_interval = reap_interval
+        self._connections: Dict[PoolKey, _PooledConnection] = {}
+        self._key_locks: Dict[PoolKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._reaper = None
+
+    @contextmanager
+    def acquire(self, host: str, port: int, username: str, ssh_key_path: str,
+                max_age: Optional[float] = None) -> Iterator[SSHClient]:
+        """Borrow a connected SSHClient; it goes back to the pool on exit instead of closing
+        
+        With max_age, a pooled connection last verified longer ago than that is
+        replaced by a fresh handshake instead of being reused.
+        """
+        key = (host, port, username, ssh_key_path)
+        entry = self._checkout(key, max_age)
+        try:
+            yield entry.ssh
+        except Exception:
+            # Command errors leave the transport usable; only drop it if it died
+            self._checkin(key, entry, broken=not entry.ssh.is_alive())
+            raise
+        else:
+            self._checkin(key, entry, broken=False)
+
+    def acquire_for(self, server: Any, max_age: Optional[float] = None) -> ContextManager[SSHClient]:
+        """acquire() for a ServerConfig-like object (host, port, username, ssh_key_path)"""
+        return self.acquire(server.host, server.port, server.username, server.ssh_key_path, max_age)
+
+    def warm(self, server: Any) -> None:
+        """Open a pooled connection to server ahead of its first use (no-op if one is live)"""
+        with self.acquire_for(server):
+            pass
+
+    def _checkout(self, key: PoolKey, max_age: Optional[float] = None) -> _PooledConnection:
+        """Return a live connection for key, connecting if needed"""
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Per-key lock so connecting to one host doesn't block the others
+        with key_lock:
+            with self._lock:
+                entry = self._connections.get(key)
+                if entry is not None:
+                    entry.users += 1
+
+            if entry is not None:
+                fresh = max_age is None or time.monotonic() - entry.verified <= max_age
+                if fresh and entry.ssh.is_alive():
+                    return entry
+                with self._lock:
+                    entry.users -= 1
+                if not fresh:
+                    # Other callers may still be using it; close it once they're done
+                    self._retire(key, entry)
+                else:
+                    host, port, username, _ = key
+                    print(f"Pooled SSH connection to {username}@{host}:{port} is no longer alive, reconnecting")
+                    self._evict(key, entry)
+
+            host, port, username, ssh_key_path = key
+            ssh = SSHClient(host=host, port=port, username=username, ssh_key_path=ssh_key_path)
+            ssh.connect()
+            entry = _PooledConnection(ssh)
+            entry.users = 1
+            with self._lock:
+                self._connections[key] = entry
+                self._start_reaper()
+            return entry
+
+    def _checkin(self, key: PoolKey, entry: _PooledConnection, broken: bool) -> None:
+        """Release a borrowed connection"""
+        with self._lock:
+            entry.users -= 1
+            entry.last_used = time.monotonic()
+            if not broken:
+                entry.verified = entry.last_used
+            done = entry.retired and entry.users == 0
+        if broken or done:
+            self._evict(key, entry)
+
+    def _retire(self, key: PoolKey, entry: _PooledConnection) -> None:
+        """Take a connection out of the pool, closing it now or when its last user checks in"""
+        with self._lock:
+            if self._connections.get(key) is entry:
+                del self._connections[key]
+            entry.retired = True
+            idle = entry.users == 0
+        if idle:
+            entry.ssh.disconnect()
+
+    def _evict(self, key: PoolKey, entry: _PooledConnection) -> None:
+        """Remove a connection from the pool and close it"""
+        with self._lock:
+            if self._connections.get(key) is entry:
+                del self._connections[key]
+        entry.ssh.disconnect()
+
+    def _start_reaper(self) -> None:
+        """Start the idle-connection reaper thread (caller holds self._lock)"""
+        if self._reaper is None:
+            self._reaper = threading.Thread(target=self._reap_loop, daemon=True)
+            self._reaper.start()
+
+    def _reap_loop(self) -> None:
+        while True:
+            time.sleep(self.reap_interval)
+            self.reap_idle()
+
+    def reap_idle(self) -> None:
+        """Close connections nobody has used within idle_timeout"""
+        now = time.monotonic()
+        with self._lock:
+            stale = [
+                (key, entry) for key, entry in self._connections.items()
+                if entry.users == 0 and now - entry.last_used > self.idle_timeout
+            ]
+            for key, _ in stale:
+                del self._connections[key]
+        for _, entry in stale:
+            entry.ssh.disconnect()
+
+    def close_all(self) -> None:
+        """Close every pooled connection"""
+        with self._lock:
+            entries = list(self._connections.values())
+            self._connections.clear()
+        for entry in entries:
+            entry.ssh.disconnect()
+
+
+# Global SSH pool instance
+_ssh_pool = SSHPool()
+
+
+def get_ssh_pool() -> SSHPool:
+    """Get the global SSH pool instance"""
+    return _ssh_pool
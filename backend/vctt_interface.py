@@ -4,24 +4,154 @@ VCTT Orchestrator Integration Module
 This module provides a simple interface for the orchestrator to interact with VCTT.
 It can be imported directly or called via command line.
 
-Usage from orchestrator:
-    import subprocess
-    result = subprocess.run(['python', 'vctt_interface.py', '--check'], capture_output=True, text=True)
-    
-Or import directly:
-    from vctt_interface import VCTTInterface
-    interface = VCTTInterface()
+Usage from orchestrator (in-process, so repeated checks share the probe caches and
+pay no interpreter startup; keep one instance around, as API does):
+    from vctt_interface import get_vctt_interface
+    interface = get_vctt_interface()
     if interface.is_installed():
         interface.launch()
+    
+Or from a shell / other tools (one Python startup per call):
+    import subprocess
+    result = subprocess.run(['python', 'vctt_interface.py', '--check'], capture_output=True, text=True)
 """
 
 import subprocess
 import sys
 import os
 import json
-import platform
+import shlex
+import shutil
+import threading
+import time
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any, List
+from typing import Optional, Tuple, Dict, Any, Callable, List, Set
+
+
+# Checked once at import (platform.system() can spawn uname on some systems)
+_IS_WINDOWS = sys.platform == 'win32'
+
+# Seconds is_installed() / get_version() results are reused; each check spawns
+# conda or the launch script, which costs hundreds of ms (more on Windows)
+_PROBE_TTL = 5.0
+
+# Upper bound on a single probe subprocess, so a hung conda or launch script
+# can't hold up the API call (and the UI waiting on it) indefinitely
+_PROBE_TIMEOUT = 30.0
+
+
+# Background probes whose output we capture shouldn't flash a console window on Windows
+_NO_WINDOW: Dict[str, Any] = {'creationflags': subprocess.CREATE_NO_WINDOW} if _IS_WINDOWS else {}
+
+
+@lru_cache(maxsize=1)
+def _conda_exe() -> str:
+    """Full path of conda (conda.bat on Windows), so it can run without a shell"""
+    return shutil.which('conda') or 'conda'
+
+
+@lru_cache(maxsize=1)
+def _conda_envs_dirs() -> Tuple[Path, ...]:
+    """Existing directories conda keeps named environments in, found without running conda"""
+    candidates = [Path(p) for p in os.environ.get('CONDA_ENVS_PATH', '').split(os.pathsep) if p]
+    # <base>/condabin/conda, <base>/bin/conda or <base>/Scripts/conda.exe -> <base>/envs
+    exe = os.environ.get('CONDA_EXE') or shutil.which('conda')
+    if exe:
+        candidates.append(Path(exe).resolve().parent.parent / 'envs')
+    # Active env: CONDA_PREFIX is the base itself or <base>/envs/<name>
+    prefix = os.environ.get('CONDA_PREFIX')
+    if prefix:
+        prefix = Path(prefix)
+        candidates.append(prefix.parent if prefix.parent.name == 'envs' else prefix / 'envs')
+    # Default install locations, for when conda isn't on PATH (e.g. launched from a GUI)
+    home = Path.home()
+    candidates += [home / base / 'envs' for base in ('miniconda3', 'anaconda3', 'miniforge3', 'mambaforge')]
+    candidates.append(home / '.conda' / 'envs')
+    # Same directory can be reached several ways; stat each only once per probe
+    return tuple(dict.fromkeys(d for d in candidates if d.is_dir()))
+
+
+def _entry_names(path: Path) -> Set[str]:
+    """Names in a directory from a single scandir (empty if missing or unreadable)"""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
+# Common installation locations, checked in order before scanning the home directory
+if _IS_WINDOWS:
+    _SEARCH_ROOTS = ("{home}/VCTT", "{home}/Documents/VCTT", "C:/VCTT", "D:/VCTT")
+else:
+    _SEARCH_ROOTS = ("{home}/VCTT", "{home}/Documents/VCTT", "/opt/VCTT", "/usr/local/VCTT")
+
+# Directories never worth descending into when looking for an installation
+# (hidden dirs are skipped as well)
+_SCAN_SKIP = frozenset({'node_modules', '__pycache__', 'venv', 'site-packages', 'Library', 'AppData'})
+
+
+def _scan_for_app_dirs(root: Path, max_depth: int, limit: int) -> List[Path]:
+    """VCTT_app directories containing main.py at most max_depth levels below root, shallowest first"""
+    found: List[Path] = []
+    pending = deque([(str(root), 1)])
+    while pending and len(found) < limit:
+        path, depth = pending.popleft()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith('.') or name in _SCAN_SKIP:
+                        continue
+                    try:
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                    except OSError:
+                        continue
+                    if name == 'VCTT_app':
+                        if os.path.isfile(os.path.join(entry.path, 'main.py')):
+                            found.append(Path(entry.path))
+                    elif depth < max_depth:
+                        pending.append((entry.path, depth + 1))
+        except OSError:
+            continue  # Missing or unreadable
+    return found[:limit]
+
+
+@lru_cache(maxsize=1)
+def _find_installations() -> Tuple[Path, ...]:
+    """VCTT_app directories in the common install locations, then under home (see find_vctt_installations)"""
+    found_paths = []
+    home = Path.home()
+    
+    # Search in each common location
+    for template in _SEARCH_ROOTS:
+        base_path = Path(template.format(home=home))
+        # One directory listing answers all the checks below
+        names = _entry_names(base_path)
+        if not names:
+            continue
+        
+        # Check for VCTT_app subdirectory
+        if "VCTT_app" in names and "main.py" in _entry_names(base_path / "VCTT_app"):
+            found_paths.append(base_path / "VCTT_app")
+        
+        # Also check if base_path itself is VCTT_app
+        if "main.py" in names and ("launch_vctt.bat" in names or "launch_vctt.sh" in names):
+            found_paths.append(base_path)
+    
+    # Also search the home directory, a few levels deep (a full rglob can take
+    # tens of seconds on a large home with caches and node_modules trees)
+    if len(found_paths) < 5:
+        for item in _scan_for_app_dirs(home, max_depth=4, limit=5):
+            if item not in found_paths:
+                found_paths.append(item)
+                if len(found_paths) >= 5:
+                    break
+    
+    return tuple(found_paths)
 
 
 class VCTTInterface:
@@ -43,7 +173,7 @@ class VCTTInterface:
             self.vctt_path = Path(__file__).parent
         
         self.env_name = "vtcc_test"
-        self.is_windows = platform.system() == 'Windows'
+        self.is_windows = _IS_WINDOWS
         
         # Cross-platform script detection
         if self.is_windows:
@@ -56,28 +186,80 @@ class VCTTInterface:
             self.install_script = self.vctt_path / "install_vctt.sh"
             self.update_script = self.vctt_path / "update_vctt.sh"
             self.bootstrap_script = Path(__file__).parent / "bootstrap_vctt.sh"
+        
+        # (monotonic time, result) of the last probes; see invalidate_cache
+        self._installed_check: Optional[Tuple[float, bool]] = None
+        self._version_checks: Dict[str, Tuple[float, Optional[str]]] = {}
+        self._path_checks: Dict[Tuple[str, str], Tuple[float, bool]] = {}
+    
+    def invalidate_cache(self) -> None:
+        """Forget cached is_installed() / get_version() / is_valid_vctt_path() results (after install, update, ...)"""
+        _find_installations.cache_clear()
+        self._installed_check = None
+        self._version_checks.clear()
+        self._path_checks.clear()
     
     def is_installed(self) -> bool:
-        """Check if VCTT environment is installed."""
+        """Check if VCTT environment is installed (cached for _PROBE_TTL seconds)."""
+        now = time.monotonic()
+        cached = self._installed_check
+        if cached and now - cached[0] < _PROBE_TTL:
+            return cached[1]
+        installed = self._probe_installed()
+        self._installed_check = (now, installed)
+        return installed
+    
+    def _probe_installed(self) -> bool:
+        """Check whether the VCTT environment exists, asking conda only if it isn't found on disk."""
+        # A stat per envs dir answers the common (installed) case; conda is only run
+        # when that misses, e.g. for envs_dirs configured in .condarc
+        if any((d / self.env_name / 'conda-meta' / 'history').is_file() for d in _conda_envs_dirs()):
+            return True
         try:
             result = subprocess.run(
-                ["conda", "info", "--envs"],
-                capture_output=True, text=True, shell=True
+                [_conda_exe(), "info", "--envs", "--json"],
+                capture_output=True, text=True, timeout=_PROBE_TIMEOUT, **_NO_WINDOW
             )
-            return self.env_name in result.stdout
+            # Exact name match: a substring test would also accept e.g. "vtcc_test_old"
+            return any(Path(env).name == self.env_name for env in json.loads(result.stdout)["envs"])
         except Exception:
             return False
     
-    def get_version(self) -> Optional[str]:
-        """Get the current VCTT version."""
-        if not self.is_installed():
-            return None
+    def get_version(self, installed: Optional[bool] = None) -> Optional[str]:
+        """Get the current VCTT version (cached for _PROBE_TTL seconds).
         
+        Args:
+            installed: is_installed() result the caller already has, to skip checking again.
+        """
+        if installed is None:
+            installed = self.is_installed()
+        if not installed:
+            return None
+        return self._get_version_unchecked()
+    
+    def _get_version_unchecked(self, vctt_path: Optional[Path] = None,
+                               launch_script: Optional[Path] = None) -> Optional[str]:
+        """get_version() for a caller that already knows VCTT is installed."""
+        vctt_path = vctt_path or self.vctt_path
+        launch_script = launch_script or self.launch_script
+        # Keyed by script: get_status() may report another installation
+        script = str(launch_script)
+        now = time.monotonic()
+        cached = self._version_checks.get(script)
+        if cached and now - cached[0] < _PROBE_TTL:
+            return cached[1]
+        version = self._probe_version(vctt_path, launch_script)
+        self._version_checks[script] = (now, version)
+        return version
+    
+    @staticmethod
+    def _probe_version(vctt_path: Path, launch_script: Path) -> Optional[str]:
+        """Run the launch script's --version."""
         try:
             result = subprocess.run(
-                [str(self.launch_script), "--version"],
-                capture_output=True, text=True, shell=True,
-                cwd=str(self.vctt_path)
+                [str(launch_script), "--version"],
+                capture_output=True, text=True, timeout=_PROBE_TIMEOUT, **_NO_WINDOW,
+                cwd=str(vctt_path)
             )
             return result.stdout.strip() if result.returncode == 0 else None
         except Exception:
@@ -93,7 +275,7 @@ class VCTTInterface:
         try:
             result = subprocess.run(
                 [str(self.launch_script), "--check-update"],
-                capture_output=True, text=True, shell=True,
+                capture_output=True, text=True, timeout=_PROBE_TIMEOUT, **_NO_WINDOW,
                 cwd=str(self.vctt_path)
             )
             update_available = "UPDATE_AVAILABLE" in result.stdout
@@ -101,51 +283,69 @@ class VCTTInterface:
         except Exception as e:
             return False, None
     
-    def install(self, wait: bool = True) -> int:
+    def install(self, wait: bool = True, on_line: Optional[Callable[[str], None]] = None) -> int:
         """
         Run the VCTT installer.
         
         Args:
             wait: If True, wait for installation to complete.
+            on_line: If given, called with each line of installer output as it arrives.
             
         Returns:
             Exit code (0 = success)
         """
-        if wait:
-            result = subprocess.run(
-                [str(self.install_script)],
-                shell=True, cwd=str(self.vctt_path)
-            )
-            return result.returncode
-        else:
-            subprocess.Popen(
-                [str(self.install_script)],
-                shell=True, cwd=str(self.vctt_path)
-            )
-            return 0
+        self.invalidate_cache()
+        return self._run_script([str(self.install_script)], wait, on_line)
     
-    def update(self, wait: bool = True) -> int:
+    def update(self, wait: bool = True, on_line: Optional[Callable[[str], None]] = None) -> int:
         """
         Run the VCTT updater.
         
         Args:
             wait: If True, wait for update to complete.
+            on_line: If given, called with each line of updater output as it arrives.
             
         Returns:
             Exit code (0 = success)
         """
-        if wait:
-            result = subprocess.run(
-                [str(self.update_script)],
-                shell=True, cwd=str(self.vctt_path)
-            )
-            return result.returncode
-        else:
-            subprocess.Popen(
-                [str(self.update_script)],
-                shell=True, cwd=str(self.vctt_path)
-            )
+        self.invalidate_cache()
+        return self._run_script([str(self.update_script)], wait, on_line)
+    
+    def _run_script(self, cmd: List[str], wait: bool, on_line: Optional[Callable[[str], None]],
+                    cwd: Optional[str] = None) -> int:
+        """
+        Run an install/update script from vctt_path (or cwd).
+        
+        Without on_line the script writes straight to our console. With it, stdout and
+        stderr are merged into one pipe that is drained line by line as output arrives
+        (on a background thread when not waiting), so the script never blocks on a full pipe.
+        
+        Returns:
+            Exit code if wait=True, else 0
+        """
+        cwd = cwd or str(self.vctt_path)
+        if on_line is None:
+            if wait:
+                return subprocess.run(cmd, cwd=cwd).returncode
+            subprocess.Popen(cmd, cwd=cwd)
             return 0
+        
+        process = subprocess.Popen(
+            cmd, cwd=cwd,
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, errors='replace', bufsize=1
+        )
+        
+        def pump() -> int:
+            with process.stdout:
+                for line in process.stdout:
+                    on_line(line.rstrip('\n'))
+            return process.wait()
+        
+        if wait:
+            return pump()
+        threading.Thread(target=pump, name='vctt-script-output', daemon=True).start()
+        return 0
     
     def launch(self, wait: bool = False, *args) -> int:
         """
@@ -162,22 +362,25 @@ class VCTTInterface:
         
         if wait:
             result = subprocess.run(
-                cmd, shell=True, cwd=str(self.vctt_path)
+                cmd, cwd=str(self.vctt_path)
             )
             return result.returncode
         else:
             subprocess.Popen(
-                cmd, shell=True, cwd=str(self.vctt_path)
+                cmd, cwd=str(self.vctt_path)
             )
             return 0
     
-    def run_bootstrap(self, install_dir: str, wait: bool = True) -> Tuple[int, str]:
+    def run_bootstrap(self, install_dir: str, wait: bool = True,
+                      on_line: Optional[Callable[[str], None]] = None) -> Tuple[int, str]:
         """
         Run the VCTT bootstrap installer.
         
         Args:
             install_dir: Directory where VCTT should be installed
             wait: If True, wait for installation to complete.
+            on_line: With wait=True, run without a console of its own and call this with
+                each line of output as it arrives (the output is also returned).
             
         Returns:
             Tuple of (exit_code, output_message)
@@ -185,10 +388,27 @@ class VCTTInterface:
         if not self.bootstrap_script.exists():
             return 1, f"Bootstrap script not found: {self.bootstrap_script}"
         
+        self.invalidate_cache()
+        
         try:
             install_path = Path(install_dir)
             install_path.mkdir(parents=True, exist_ok=True)
             
+            if wait and on_line is not None:
+                # A new console (Windows) or inherited stdout would leave nothing to return
+                if self.is_windows:
+                    cmd = [str(self.bootstrap_script)]
+                else:
+                    cmd = ['bash', str(self.bootstrap_script.resolve()), install_dir]
+                lines: List[str] = []
+                
+                def collect(line: str) -> None:
+                    lines.append(line)
+                    on_line(line)
+                
+                exit_code = self._run_script(cmd, True, collect, cwd=str(install_path.parent.resolve()))
+                return exit_code, "\n".join(lines)
+            
             if self.is_windows:
                 # Windows: run batch file in a new console window
                 # Use 'start' command to ensure a new visible terminal window
@@ -196,8 +416,7 @@ class VCTTInterface:
                 if wait:
                     # For wait=True, use CREATE_NEW_CONSOLE
                     result = subprocess.run(
-                        bootstrap_path,
-                        shell=True,
+                        [bootstrap_path],
                         cwd=str(install_path.parent),
                         creationflags=subprocess.CREATE_NEW_CONSOLE
                     )
@@ -238,16 +457,16 @@ class VCTTInterface:
                     output = result.stdout if result.stdout else ""
                     return result.returncode, output
                 else:
-                    # Spawn in new terminal window
-                    import platform
-                    system = platform.system()
-                    
-                    if system == 'Darwin':  # macOS
+                    # Spawn in new terminal window; every path is quoted, install_dir may contain spaces
+                    shell_cmd = (f"cd {shlex.quote(work_dir_abs)} && "
+                                 f"bash {shlex.quote(bootstrap_abs)} {shlex.quote(install_dir)}")
+                    if sys.platform == 'darwin':  # macOS
                         # Use osascript to open Terminal.app with the script
+                        script_literal = shell_cmd.replace('\\', '\\\\').replace('"', '\\"')
                         script_content = f'''
 tell application "Terminal"
     activate
-    do script "cd \\"{work_dir_abs}\\" && bash \\"{bootstrap_abs}\\" {install_dir}"
+    do script "{script_literal}"
 end tell
 '''
                         subprocess.Popen(
@@ -257,15 +476,17 @@ end tell
                         )
                         return 0, "Bootstrap installer started in new Terminal window"
                     else:  # Linux
-                        # Try common terminal emulators
+                        # Try common terminal emulators (only those on PATH, instead of a failed exec each)
                         terminals = [
-                            ['gnome-terminal', '--', 'bash', '-c', f'cd "{work_dir_abs}" && bash "{bootstrap_abs}" {install_dir}; exec bash'],
-                            ['xterm', '-e', 'bash', '-c', f'cd "{work_dir_abs}" && bash "{bootstrap_abs}" {install_dir}; exec bash'],
-                            ['konsole', '-e', 'bash', '-c', f'cd "{work_dir_abs}" && bash "{bootstrap_abs}" {install_dir}; exec bash'],
-                            ['x-terminal-emulator', '-e', 'bash', '-c', f'cd "{work_dir_abs}" && bash "{bootstrap_abs}" {install_dir}; exec bash'],
+                            ['gnome-terminal', '--', 'bash', '-c', f'{shell_cmd}; exec bash'],
+                            ['xterm', '-e', 'bash', '-c', f'{shell_cmd}; exec bash'],
+                            ['konsole', '-e', 'bash', '-c', f'{shell_cmd}; exec bash'],
+                            ['x-terminal-emulator', '-e', 'bash', '-c', f'{shell_cmd}; exec bash'],
                         ]
                         
                         for term_cmd in terminals:
+                            if not shutil.which(term_cmd[0]):
+                                continue
                             try:
                                 process = subprocess.Popen(
                                     term_cmd,
@@ -301,8 +522,7 @@ end tell
             True if bootstrap is still running, False otherwise
         """
         # Check Windows processes (use absolute path as key)
-        import platform
-        if platform.system() == 'Windows':
+        if _IS_WINDOWS:
             install_path = Path(install_dir).resolve()
             install_dir_abs = str(install_path)
             if install_dir_abs in VCTTInterface._bootstrap_processes:
@@ -328,96 +548,59 @@ end tell
     
     def is_valid_vctt_path(self) -> bool:
         """
-        Check if the current vctt_path is a valid VCTT installation.
+        Check if the current vctt_path is a valid VCTT installation (cached for _PROBE_TTL seconds).
         
         Returns:
             True if path contains VCTT_app with main.py and launch scripts
         """
-        # Check for VCTT_app subdirectory
-        vctt_app_dir = self.vctt_path / "VCTT_app"
-        if vctt_app_dir.exists() and vctt_app_dir.is_dir():
-            # Check for main.py
-            main_py = vctt_app_dir / "main.py"
-            if main_py.exists():
-                # Check for launch script
-                if self.launch_script.exists() or (vctt_app_dir / self.launch_script.name).exists():
-                    return True
+        return self._check_vctt_path(self.vctt_path, self.launch_script)
+    
+    def _check_vctt_path(self, vctt_path: Path, launch_script: Path) -> bool:
+        """is_valid_vctt_path() for any directory, sharing its cache."""
+        # Keyed by paths: other directories are checked too (is_configured_in_orchestrator)
+        key = (str(vctt_path), str(launch_script))
+        now = time.monotonic()
+        cached = self._path_checks.get(key)
+        if cached and now - cached[0] < _PROBE_TTL:
+            return cached[1]
+        valid = self._probe_vctt_path(vctt_path, launch_script)
+        self._path_checks[key] = (now, valid)
+        return valid
+    
+    @staticmethod
+    def _probe_vctt_path(vctt_path: Path, launch_script: Path) -> bool:
+        """Look for main.py and the launch script under vctt_path."""
+        # One directory listing answers the checks below instead of a stat each
+        names = _entry_names(vctt_path)
+        if launch_script.parent == vctt_path:
+            launch_exists = launch_script.name in names
+        else:
+            launch_exists = launch_script.exists()
         
-        # Also check if vctt_path itself is VCTT_app
-        main_py = self.vctt_path / "main.py"
-        if main_py.exists() and self.launch_script.exists():
-            return True
+        # Check for VCTT_app subdirectory (listed only if there is one)
+        if "VCTT_app" in names:
+            app_names = _entry_names(vctt_path / "VCTT_app")
+            # Check for main.py and the launch script
+            if "main.py" in app_names and (launch_exists or launch_script.name in app_names):
+                return True
         
-        return False
+        # Also check if vctt_path itself is VCTT_app
+        return "main.py" in names and launch_exists
     
     @staticmethod
     def find_vctt_installations() -> List[Path]:
         """
-        Search for VCTT installations on the system.
+        Search for VCTT installations on the system (scanned once, until rescan_installations()).
         
         Returns:
             List of paths to VCTT_app directories
         """
-        import os
-        found_paths = []
-        
-        # Common installation locations
-        search_paths = []
-        
-        # Get home directory
-        home = Path.home()
-        
-        # Windows common locations
-        if platform.system() == 'Windows':
-            search_paths = [
-                home / "VCTT",
-                home / "Documents" / "VCTT",
-                Path("C:/VCTT"),
-                Path("D:/VCTT"),
-            ]
-        else:
-            # Mac/Linux common locations
-            search_paths = [
-                home / "VCTT",
-                home / "Documents" / "VCTT",
-                Path("/opt/VCTT"),
-                Path("/usr/local/VCTT"),
-            ]
-        
-        # Search in each location
-        for base_path in search_paths:
-            if not base_path.exists():
-                continue
-            
-            # Check for VCTT_app subdirectory
-            vctt_app = base_path / "VCTT_app"
-            if vctt_app.exists() and (vctt_app / "main.py").exists():
-                found_paths.append(vctt_app)
-            
-            # Also check if base_path itself is VCTT_app
-            if (base_path / "main.py").exists() and (
-                (base_path / "launch_vctt.bat").exists() or 
-                (base_path / "launch_vctt.sh").exists()
-            ):
-                found_paths.append(base_path)
-        
-        # Also search recursively in home directory (limited depth)
-        try:
-            for path in [home / "VCTT", home]:
-                if path.exists():
-                    for item in path.rglob("VCTT_app"):
-                        if item.is_dir() and (item / "main.py").exists():
-                            if item not in found_paths:
-                                found_paths.append(item)
-                            # Limit search depth
-                            if len(found_paths) >= 5:
-                                break
-                    if len(found_paths) >= 5:
-                        break
-        except Exception:
-            pass  # Ignore permission errors
-        
-        return found_paths
+        return list(_find_installations())
+    
+    @staticmethod
+    def rescan_installations() -> None:
+        """Make the next find_vctt_installations() search the disk again."""
+        _find_installations.cache_clear()
     
     def is_configured_in_orchestrator(self) -> Tuple[bool, Optional[str]]:
         """
@@ -428,17 +611,17 @@ end tell
         """
         try:
             from config import AppConfig
-            config = AppConfig.load()
+            config = AppConfig.load_cached()
             
             for app in config.local_apps:
                 # Check if this app points to VCTT
-                if 'VCTT' in app.name or 'vctt' in app.name.lower():
+                if 'vctt' in app.name.lower():
                     # Verify the path exists and is valid
                     app_path = Path(app.executable_path)
                     if app_path.exists():
-                        # Check if it's a valid VCTT path
-                        vctt_check = VCTTInterface(str(app_path.parent))
-                        if vctt_check.is_valid_vctt_path():
+                        # Check if it's a valid VCTT path (cached, no extra VCTTInterface)
+                        app_dir = app_path.parent
+                        if self._check_vctt_path(app_dir, app_dir / self.launch_script.name):
                             return True, app.id
             
             return False, None
@@ -457,7 +640,9 @@ end tell
             configured, app_id = self.is_configured_in_orchestrator()
             valid_path = self.is_valid_vctt_path()
             
-            # If current path is not valid, try to find VCTT installations
+            # If current path is not valid, try to find VCTT installations. The one found
+            # is only reported: this instance is shared, so its own paths stay as they are
+            vctt_path, launch_script = self.vctt_path, self.launch_script
             found_installations = []
             if not valid_path:
                 try:
@@ -465,12 +650,8 @@ end tell
                     if found_installations:
                         # Use the first found installation
                         best_path = found_installations[0]
-                        self.vctt_path = best_path
-                        # Update script paths
-                        if self.is_windows:
-                            self.launch_script = self.vctt_path / "launch_vctt.bat"
-                        else:
-                            self.launch_script = self.vctt_path / "launch_vctt.sh"
+                        vctt_path = best_path
+                        launch_script = best_path / self.launch_script.name
                         valid_path = True
                         print(f"Found VCTT installation at: {best_path}")
                 except Exception as e:
@@ -480,15 +661,15 @@ end tell
                 "installed": installed,
                 "configured": configured,
                 "app_id": app_id,
-                "version": self.get_version() if installed and valid_path else None,
-                "path": str(self.vctt_path),
+                "version": self._get_version_unchecked(vctt_path, launch_script) if installed and valid_path else None,
+                "path": str(vctt_path),
                 "valid_path": valid_path,
                 "found_installations": [str(p) for p in found_installations],
-                "launch_script": str(self.launch_script),
+                "launch_script": str(launch_script),
                 "bootstrap_script": str(self.bootstrap_script),
                 "bootstrap_exists": self.bootstrap_script.exists(),
                 "scripts_exist": {
-                    "launch": self.launch_script.exists(),
+                    "launch": launch_script.exists(),
                     "install": self.install_script.exists(),
                     "update": self.update_script.exists(),
                 }
@@ -506,6 +687,21 @@ end tell
             }
 
 
+# Shared instances by requested vctt_path, so repeated callers reuse one set of probe caches
+_interfaces: Dict[Optional[str], VCTTInterface] = {}
+_interfaces_lock = threading.Lock()
+
+
+def get_vctt_interface(vctt_path: Optional[str] = None) -> VCTTInterface:
+    """Get the shared VCTTInterface for vctt_path (None: this script's directory)"""
+    key = str(Path(vctt_path)) if vctt_path else None
+    with _interfaces_lock:
+        interface = _interfaces.get(key)
+        if interface is None:
+            interface = _interfaces[key] = VCTTInterface(vctt_path)
+        return interface
+
+
 def main():
     """Command line interface for orchestrator integration."""
     import argparse
@@ -522,11 +718,12 @@ def main():
     
     args = parser.parse_args()
     
-    interface = VCTTInterface(args.path)
+    interface = get_vctt_interface(args.path)
     
     if args.check:
-        print("INSTALLED" if interface.is_installed() else "NOT_INSTALLED")
-        sys.exit(0 if interface.is_installed() else 1)
+        installed = interface.is_installed()
+        print("INSTALLED" if installed else "NOT_INSTALLED")
+        sys.exit(0 if installed else 1)
     
     elif args.version:
         version = interface.get_version()
@@ -2,6 +2,7 @@
 import PyInstaller.__main__
 import sys
 import os
+import shutil
 from pathlib import Path
 
 def build():
@@ -15,14 +16,30 @@ def build():
     args = [
         str(project_root / 'backend' / 'main.py'),
         '--name=Orchestrator',
-        '--onefile',
+        # A folder instead of --onefile: a one-file build unpacks the whole bundle to a
+        # temp dir on every launch, which adds up to a second or more to startup
+        '--onedir',
+        '--noupx',  # UPX-packed binaries would be decompressed on every start too
         '--windowed',  # No console window
         f'--add-data={src_dir}{os.pathsep}src',
         f'--add-data={icons_dir}{os.pathsep}icons',
-        '--hidden-import=backend.config',
-        '--hidden-import=backend.ssh_client',
-        '--hidden-import=backend.process_manager',
-        '--hidden-import=backend.api',
+        # main.py imports its siblings as top-level modules (backend/ is the script dir)
+        '--hidden-import=config',
+        '--hidden-import=ssh_client',
+        '--hidden-import=ssh_pool',
+        '--hidden-import=log_streams',
+        '--hidden-import=process_manager',
+        '--hidden-import=api',
+        '--hidden-import=vctt_interface',
+        # Compile bundled modules with asserts stripped (-O); not -OO, since some
+        # dependencies read their own docstrings
+        '--optimize=1',
+        # Pulled in by stdlib/dependency imports but never used at runtime
+        # (tkinter stays: the folder picker dialog uses it)
+        '--exclude-module=unittest',
+        '--exclude-module=doctest',
+        '--exclude-module=pydoc',
+        '--exclude-module=test',
         '--clean',
     ]
     
@@ -37,8 +54,12 @@ def build():
     
     try:
         PyInstaller.__main__.run(args)
+        app_dir = project_root / 'dist' / 'Orchestrator'
+        # Single file to hand out; unzip once and run the executable inside the folder
+        archive = shutil.make_archive(str(app_dir), 'zip', root_dir=app_dir.parent, base_dir=app_dir.name)
         print("\n✓ Build completed successfully!")
-        print(f"Executable location: {project_root / 'dist' / 'Orchestrator.exe' if sys.platform == 'win32' else project_root / 'dist' / 'Orchestrator'}")
+        print(f"Executable location: {app_dir / 'Orchestrator.exe' if sys.platform == 'win32' else app_dir / 'Orchestrator'}")
+        print(f"Distribution archive: {archive}")
     except Exception as e:
         print(f"\n✗ Build failed: {e}")
         sys.exit(1)
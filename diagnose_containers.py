@@ -1,5 +1,6 @@
 """Diagnostic tool to check container name matching"""
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add backend to path
@@ -8,13 +9,33 @@ sys.path.insert(0, str(Path(__file__).parent / 'backend'))
 from config import AppConfig
 from ssh_client import SSHClient
 
-def diagnose_server(server_id):
-    """Diagnose container detection for a specific server"""
+def probe_server(server):
+    """Connect to a server and probe all its services in one remote exec
+    
+    Returns (probes, error): probes is bulk_service_status's (containers, healthy) per service.
+    """
+    try:
+        with SSHClient(
+            host=server.host,
+            port=server.port,
+            username=server.username,
+            ssh_key_path=server.ssh_key_path
+        ) as ssh:
+            return ssh.bulk_service_status(server.services), None
+    except Exception as e:
+        return None, e
+
+def diagnose_server(server_id, probed=None, config=None):
+    """Diagnose container detection for a specific server
+    
+    probed: probe_server's result, if already fetched; config: the loaded AppConfig, to avoid re-reading it.
+    """
     print(f"\n{'='*70}")
     print(f"DIAGNOSING SERVER: {server_id}")
     print(f"{'='*70}\n")
     
-    config = AppConfig.load()
+    if config is None:
+        config = AppConfig.load()
     server = config.get_server(server_id)
     
     if not server:
@@ -26,75 +47,60 @@ def diagnose_server(server_id):
     print(f"Host: {server.host}")
     print(f"Services configured: {len(server.services)}\n")
     
-    try:
-        with SSHClient(
-            host=server.host,
-            port=server.port,
-            username=server.username,
-            ssh_key_path=server.ssh_key_path
-        ) as ssh:
-            print(f"✓ SSH connection successful\n")
-            
-            for i, service in enumerate(server.services, 1):
-                print(f"\n--- Service {i}/{len(server.services)}: {service.name} ---")
-                print(f"  Configured container name: '{service.container_name}'")
-                print(f"  Path: {service.path}")
-                print(f"  Port: {service.port}")
-                print(f"  Health check: {service.healthcheck_path}")
-                
-                try:
-                    containers = ssh.check_containers_at_path(service.path)
-                    print(f"\n  Containers found: {len(containers)}")
-                    
-                    if containers:
-                        for c in containers:
-                            status_icon = "🟢" if c.state == "running" else "🔴"
-                            print(f"    {status_icon} {c.name}")
-                            print(f"       Status: {c.status}")
-                            print(f"       State: {c.state}")
-                            
-                            # Check matching
-                            config_lower = service.container_name.lower()
-                            container_lower = c.name.lower()
-                            
-                            matches = []
-                            if config_lower == container_lower:
-                                matches.append("exact match")
-                            if config_lower in container_lower:
-                                matches.append("config in container")
-                            if container_lower in config_lower:
-                                matches.append("container in config")
-                            
-                            if matches:
-                                print(f"       ✓ Matches: {', '.join(matches)}")
-                            else:
-                                print(f"       ✗ No match with '{service.container_name}'")
-                    else:
-                        print(f"    ⚠ No containers found at this path")
-                        print(f"    Check if docker-compose.yml exists at: {service.path}")
-                    
-                    # Check health
-                    print(f"\n  Health check:")
-                    try:
-                        healthy = ssh.check_service_health(service.port, service.healthcheck_path)
-                        if healthy:
-                            print(f"    ✓ Service is healthy (HTTP 200)")
-                        else:
-                            print(f"    ✗ Health check failed")
-                            print(f"    URL: http://localhost:{service.port}{service.healthcheck_path}")
-                            print(f"    (This is normal for non-HTTP services)")
-                    except Exception as e:
-                        print(f"    ✗ Health check error: {e}")
-                    
-                except Exception as e:
-                    print(f"  ❌ Error checking containers: {e}")
-                    import traceback
-                    traceback.print_exc()
-            
-    except Exception as e:
-        print(f"❌ SSH connection failed: {e}")
+    probes, error = probed if probed is not None else probe_server(server)
+    if error is not None:
+        print(f"❌ SSH check failed: {error}")
         import traceback
-        traceback.print_exc()
+        traceback.print_exception(error)
+        return
+    
+    print(f"✓ SSH connection successful\n")
+    
+    for i, (service, (containers, healthy)) in enumerate(zip(server.services, probes), 1):
+        print(f"\n--- Service {i}/{len(server.services)}: {service.name} ---")
+        print(f"  Configured container name: '{service.container_name}'")
+        print(f"  Path: {service.path}")
+        print(f"  Port: {service.port}")
+        print(f"  Health check: {service.healthcheck_path}")
+        
+        print(f"\n  Containers found: {len(containers)}")
+        
+        if containers:
+            config_lower = service.container_name.lower()
+            for c in containers:
+                status_icon = "🟢" if c.state == "running" else "🔴"
+                print(f"    {status_icon} {c.name}")
+                print(f"       Status: {c.status}")
+                print(f"       State: {c.state}")
+                
+                # Check matching (an exact match is also a substring both ways)
+                container_lower = c.name.lower()
+                
+                if config_lower == container_lower:
+                    matches = ["exact match", "config in container", "container in config"]
+                elif config_lower in container_lower:
+                    matches = ["config in container"]
+                elif container_lower in config_lower:
+                    matches = ["container in config"]
+                else:
+                    matches = []
+                
+                if matches:
+                    print(f"       ✓ Matches: {', '.join(matches)}")
+                else:
+                    print(f"       ✗ No match with '{service.container_name}'")
+        else:
+            print(f"    ⚠ No containers found at this path")
+            print(f"    Check if docker-compose.yml exists at: {service.path}")
+        
+        # Check health
+        print(f"\n  Health check:")
+        if healthy:
+            print(f"    ✓ Service is healthy (HTTP 200)")
+        else:
+            print(f"    ✗ Health check failed")
+            print(f"    URL: http://localhost:{service.port}{service.healthcheck_path}")
+            print(f"    (This is normal for non-HTTP services)")
 
 def main():
     """Main diagnostic function"""
@@ -115,11 +121,13 @@ def main():
     if len(sys.argv) > 1:
         # Server ID provided as argument
         server_id = sys.argv[1]
-        diagnose_server(server_id)
+        diagnose_server(server_id, config=config)
     else:
-        # Diagnose all servers
-        for server in config.servers:
-            diagnose_server(server.id)
+        # Diagnose all servers: probe them concurrently (network-bound), then report in order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(probe_server, config.servers))
+        for server, probed in zip(config.servers, results):
+            diagnose_server(server.id, probed, config)
     
     print("\n" + "="*70)
     print("RECOMMENDATIONS")
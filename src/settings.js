@@ -22,7 +22,8 @@ function generateId() {
 async function loadConfig() {
     try {
         await waitForAPI();
-        config = await window.pywebview.api.load_config();
+        // JSON string from the backend: avoids building/encoding intermediate dicts
+        config = JSON.parse(await window.pywebview.api.load_config_json());
         console.log("Loaded config:", config);
         
         // Ensure config has the right structure
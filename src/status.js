@@ -313,6 +313,8 @@ window.addEventListener("beforeunload", () => {
     if (refreshInterval) {
         clearInterval(refreshInterval);
     }
+    // Stop open modals' log streams so their remote `docker logs -f` doesn't outlive the window
+    activeModals.forEach(stopLogPolling);
 });
 
 // Restart container
@@ -380,6 +382,7 @@ async function viewContainerLogs(serverId, serviceId, containerName) {
         containerName,
         lastTimestamp: null,
         pollInterval: null,
+        streamId: null,
         totalLines: 0,
         logsText: ''
     };
@@ -445,9 +448,63 @@ async function loadInitialLogs(modalState, logsContent) {
     }
 }
 
-// Start log polling
-function startLogPolling(modalState, logsContent) {
-    stopLogPolling(modalState); // Clear any existing interval
+// Append new log output to the modal, keeping the last 500 lines
+function appendLogs(modalState, logsContent, newLogs) {
+    modalState.logsText += '\n' + newLogs.replace(/\n$/, '');
+    
+    // Truncate to last 500 lines
+    const lines = modalState.logsText.split('\n');
+    if (lines.length > 500) {
+        modalState.logsText = lines.slice(-500).join('\n');
+    }
+    
+    modalState.totalLines = modalState.logsText.split('\n').length;
+    modalState.lastTimestamp = new Date().toISOString();
+    displayLogs(logsContent, modalState.logsText, true);
+}
+
+// Start log polling: follow logs over a backend stream, falling back to
+// repeated get_container_logs_since calls if the stream can't be used
+async function startLogPolling(modalState, logsContent) {
+    stopLogPolling(modalState); // Clear any existing interval/stream
+    
+    try {
+        await waitForAPI();
+        const streamId = await window.pywebview.api.start_log_stream(
+            modalState.serverId,
+            modalState.serviceId,
+            modalState.containerName,
+            modalState.lastTimestamp
+        );
+        modalState.streamId = streamId;
+        
+        // Reads only drain the backend buffer, so polling often is cheap
+        modalState.pollInterval = setInterval(async () => {
+            try {
+                const result = await window.pywebview.api.read_log_stream(streamId);
+                
+                if (result.logs && result.logs.trim()) {
+                    appendLogs(modalState, logsContent, result.logs);
+                }
+                
+                if (!result.active) {
+                    // Stream ended (connection dropped or docker logs exited)
+                    console.warn('Log stream ended:', result.error);
+                    startIncrementalPolling(modalState, logsContent);
+                }
+            } catch (error) {
+                console.error('Error reading log stream:', error);
+            }
+        }, 1000);
+    } catch (error) {
+        console.warn('Log streaming unavailable, polling instead:', error);
+        startIncrementalPolling(modalState, logsContent);
+    }
+}
+
+// Poll for logs since the last timestamp (fallback when streaming fails)
+function startIncrementalPolling(modalState, logsContent) {
+    stopLogPolling(modalState);
     
     modalState.pollInterval = setInterval(async () => {
         try {
@@ -460,18 +517,7 @@ function startLogPolling(modalState, logsContent) {
             );
             
             if (newLogs && !newLogs.startsWith('Error:') && newLogs.trim()) {
-                // Append new logs
-                modalState.logsText += '\n' + newLogs;
-                
-                // Truncate to last 500 lines
-                const lines = modalState.logsText.split('\n');
-                if (lines.length > 500) {
-                    modalState.logsText = lines.slice(-500).join('\n');
-                }
-                
-                modalState.totalLines = modalState.logsText.split('\n').length;
-                modalState.lastTimestamp = new Date().toISOString();
-                displayLogs(logsContent, modalState.logsText, true);
+                appendLogs(modalState, logsContent, newLogs);
             } else if (newLogs && newLogs.startsWith('Error:')) {
                 // Show error but keep polling
                 logsContent.innerHTML = `<span style="color: #d32f2f;">${newLogs}</span>`;
@@ -488,6 +534,11 @@ function stopLogPolling(modalState) {
         clearInterval(modalState.pollInterval);
         modalState.pollInterval = null;
     }
+    if (modalState.streamId) {
+        const streamId = modalState.streamId;
+        modalState.streamId = null;
+        window.pywebview.api.stop_log_stream(streamId).catch(() => {});
+    }
 }
 
 // Display logs with ANSI color conversion
@@ -0,0 +1,139 @@
+"""Test script for SSHClient.bulk_service_status output parsing (no SSH connection needed)"""
+import sys
+import re
+import json
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent / 'backend'))
+
+from config import ServiceConfig
+from ssh_client import SSHClient
+
+def _service(id, path, port):
+    return ServiceConfig(id=id, name=id, container_name=id, port=port, path=path)
+
+def _ps(*names):
+    """`docker compose ps --format json` lines for running containers"""
+    return [json.dumps({"Name": name, "Status": "Up", "State": "running"}) for name in names]
+
+class _CannedClient(SSHClient):
+    """SSHClient whose execute_command answers with canned sections instead of running the script
+    
+    sections(ps_marker, health_marker) returns the output lines; the markers carry the
+    per-call nonce, read back from the script bulk_service_status sends.
+    """
+    
+    def __init__(self, sections):
+        super().__init__(host="test", port=22, username="test", ssh_key_path="/dev/null")
+        self.sections = sections
+        self.scripts = []
+    
+    def execute_command(self, cmd, timeout=30):
+        self.scripts.append(cmd)
+        ps_marker = re.search(r"echo '(__ORCH_PS__\w+) 0'", cmd).group(1)
+        health_marker = re.search(r"echo '(__ORCH_HEALTH__\w+) 0'", cmd).group(1)
+        return "\n".join(self.sections(ps_marker, health_marker)) + "\n"
+
+def test_ordering():
+    """Results follow input order, whatever order the sections come back in"""
+    print("=" * 60)
+    print("Testing section order and shared compose paths")
+    print("=" * 60)
+    
+    services = [_service("web", "/srv/a", 8080), _service("api", "/srv/b", 9000), _service("worker", "/srv/a", 8081)]
+    ssh = _CannedClient(lambda ps, health: [
+        # Sections deliberately out of order
+        f"{health} 2", "000000",
+        f"{ps} 1", *_ps("b-api-1"), "",
+        f"{health} 0", "200",
+        f"{ps} 0", *_ps("a-web-1", "a-worker-1"), "",
+        f"{health} 1", "503",
+    ])
+    results = ssh.bulk_service_status(services)
+    
+    assert len(ssh.scripts) == 1, "Should run a single remote command"
+    assert ssh.scripts[0].count("cd /srv/a &&") == 1, "Services sharing a path should share one compose ps"
+    assert [c.name for c in results[0][0]] == ["a-web-1", "a-worker-1"], "web should get /srv/a's containers"
+    assert [c.name for c in results[1][0]] == ["b-api-1"], "api should get /srv/b's containers"
+    assert results[2][0] is results[0][0], "Services on the same path should share one container list"
+    assert [healthy for _, healthy in results] == [True, False, False], "Health should follow input order"
+    print("[PASS] Sections are matched to services by index, not position")
+    
+    # curl printing nothing but the failure fallback
+    assert results[2][1] is False, "'000' fallback should count as unhealthy"
+    print("[PASS] curl's 000 fallback is unhealthy")
+    return True
+
+def test_missing_section():
+    """A section missing from the output reads as no containers / unhealthy"""
+    print("\n" + "=" * 60)
+    print("Testing missing sections")
+    print("=" * 60)
+    
+    services = [_service("web", "/srv/a", 8080), _service("api", "/srv/b", 9000)]
+    ssh = _CannedClient(lambda ps, health: [
+        f"{ps} 0", *_ps("a-web-1"), "",
+        f"{health} 0", "200",
+        # No ps section for /srv/b, no health section for api
+    ])
+    results = ssh.bulk_service_status(services)
+    
+    assert [c.name for c in results[0][0]] == ["a-web-1"], "web should be unaffected"
+    assert results[0][1] is True, "web should be healthy"
+    assert results[1] == ([], False), "api should have no containers and be unhealthy"
+    print("[PASS] Missing sections give no containers and unhealthy")
+    return True
+
+def test_marker_lookalike():
+    """Lines that look like markers but lack this call's nonce stay in their section"""
+    print("\n" + "=" * 60)
+    print("Testing marker lookalikes in compose output")
+    print("=" * 60)
+    
+    services = [_service("web", "/srv/a", 8080), _service("api", "/srv/b", 9000)]
+    ssh = _CannedClient(lambda ps, health: [
+        f"{ps} 0",
+        # Printed by a container or a previous run: same prefixes, different (or no) nonce
+        "__ORCH_PS__000000000000 1",
+        "__ORCH_HEALTH__ 1",
+        *_ps("a-web-1"), "",
+        f"{ps} 1", *_ps("b-api-1"), "",
+        f"{health} 0", "200",
+        f"{health} 1", "200",
+    ])
+    results = ssh.bulk_service_status(services)
+    
+    assert [c.name for c in results[0][0]] == ["a-web-1"], "Lookalike lines must not start a new section"
+    assert [c.name for c in results[1][0]] == ["b-api-1"], "/srv/b's section should be untouched"
+    assert [healthy for _, healthy in results] == [True, True], "Health sections should be untouched"
+    print("[PASS] Only this call's nonce markers split the output")
+    return True
+
+def main():
+    """Run all tests"""
+    print("\n" + "=" * 60)
+    print("BULK SERVICE STATUS PARSING TESTS")
+    print("=" * 60)
+    
+    try:
+        for name, test in (("Ordering", test_ordering), ("Missing section", test_missing_section),
+                           ("Marker lookalike", test_marker_lookalike)):
+            if not test():
+                print(f"\n[FAIL] {name} test failed!")
+                return False
+        
+        print("\n" + "=" * 60)
+        print("[SUCCESS] ALL TESTS PASSED!")
+        print("=" * 60)
+        return True
+    
+    except Exception as e:
+        print(f"\n[ERROR] Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
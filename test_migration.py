@@ -9,6 +9,20 @@ sys.path.insert(0, str(Path(__file__).parent / 'backend'))
 
 from config import AppConfig, ServerConfig, ServiceConfig
 
+# Set TEST_VERBOSE=1 to also print the full config JSON at each step
+VERBOSE = bool(os.environ.get("TEST_VERBOSE"))
+
+try:
+    import orjson  # Optional, as in config.py
+except ImportError:
+    orjson = None
+
+def _pretty(obj):
+    """Indented JSON for display (orjson's C encoder when installed)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, indent=2)
+
 def test_migration():
     """Test v1.0 to v2.0 config migration"""
     print("=" * 60)
@@ -38,15 +52,18 @@ def test_migration():
         }
     }
     
-    print("\n[OK] Created v1.0 config:")
-    print(json.dumps(old_config, indent=2))
+    print("\n[OK] Created v1.0 config")
+    if VERBOSE:
+        print(_pretty(old_config))
     
     # Migrate
     print("\n[MIGRATING] to v2.0...")
-    migrated = AppConfig._migrate_v1_to_v2(old_config.copy())
+    # Steps build new dicts, so no defensive copy is needed
+    migrated = AppConfig._migrate(old_config)
     
-    print("\n[OK] Migrated config:")
-    print(json.dumps(migrated, indent=2))
+    print("\n[OK] Migrated config")
+    if VERBOSE:
+        print(_pretty(migrated))
     
     # Verify migration
     assert migrated['version'] == '2.0', "Version should be 2.0"
@@ -61,6 +78,9 @@ def test_migration():
     assert 'portal_port' not in migrated['servers'][0], "portal_port should be removed"
     assert 'portal_path' not in migrated['servers'][0], "portal_path should be removed"
     
+    assert old_config['version'] == '1.0', "Input config should be left untouched"
+    assert 'portal_port' in old_config['servers'][0], "Input servers should be left untouched"
+    
     print("\n[PASS] Migration verification passed!")
     return True
 
@@ -101,13 +121,12 @@ def test_multi_service():
         ]
     )
     
-    config.servers.append(server)
+    config.add_server(server)
     
     print("\n[OK] Created multi-service config:")
     print(f"  Server: {server.name}")
     print(f"  Services: {len(server.services)}")
-    for service in server.services:
-        print(f"    - {service.name} (port {service.port})")
+    print("\n".join(f"    - {service.name} (port {service.port})" for service in server.services))
     
     # Test get_service
     result = config.get_service("multi-server", "ai-portal")
@@ -221,12 +240,17 @@ def test_save_load():
     
     print("[PASS] Verification passed!")
     
-    # Show saved JSON
-    with open(AppConfig.get_config_path(), 'r') as f:
-        saved_json = json.load(f)
+    # Until the file changes, repeated loads come from memory (mtime + size keyed)
+    assert AppConfig.load_cached() is config, "load_cached() should reuse the config just saved"
+    assert AppConfig.load_cached() is AppConfig.load_cached(), "load_cached() should not re-read an unchanged file"
+    print("[PASS] load_cached() reuses the saved config")
     
-    print("\n[OK] Saved JSON structure:")
-    print(json.dumps(saved_json, indent=2))
+    # Show saved JSON (the document save() wrote, kept by the cache)
+    if VERBOSE:
+        raw = AppConfig.load_cached_json()
+        saved_json = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        print("\n[OK] Saved JSON structure:")
+        print(_pretty(saved_json))
     
     return True
 